@@ -1,7 +1,8 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.v1.endpoints import text, audio, video, analysis, complete
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(text.router, prefix="/text", tags=["text"])
 api_router.include_router(audio.router, prefix="/audio", tags=["audio"])
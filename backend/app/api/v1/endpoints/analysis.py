@@ -1,7 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
+import orjson
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/complete")
@@ -15,6 +17,10 @@ async def complete_analysis() -> Dict[str, Any]:
     }
 
 
+# Constant body, encoded once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "multi-modal-analysis"})
+
+
 @router.get("/health")
-async def analysis_health():
-    return {"status": "healthy", "service": "multi-modal-analysis"}
+async def analysis_health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,19 +1,42 @@
 """Complete multi-modal analysis endpoint"""
-from fastapi import APIRouter, HTTPException
+import asyncio
+
+import orjson
+
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Optional
 from app.ml.fusion_engine import get_fusion_engine, FusionStrategy
-from app.schemas.analysis import AnalysisResponse, AnalysisStatus, CompleteAnalysisResult
+from app.schemas.analysis import AnalysisStatus, FileType
+from app.services.analysis_store import get_analysis_store
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Unknown strategy names fall back to weighted average
+_STRATEGY_MAP = {s.value: s for s in FusionStrategy}
 
-@router.post("/analyze-complete")
+
+async def _load_result(
+    file_type: FileType,
+    analysis_id: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Return the result data of a completed analysis of this modality, or None"""
+    if not analysis_id:
+        return None
+    
+    stored = await get_analysis_store().get(file_type, analysis_id)
+    if stored is None or stored['status'] != AnalysisStatus.COMPLETED:
+        return None
+    return stored.get('result_data')
+
+
+@router.post("/analyze-complete", response_model=None)
 async def analyze_complete(
     text_analysis_id: Optional[str] = None,
     audio_analysis_id: Optional[str] = None,
     video_analysis_id: Optional[str] = None,
     fusion_strategy: str = "weighted_average"
-) -> Dict[str, Any]:
+) -> Response:
     """
     Combine results from text, audio, and video analysis
     using multi-modal fusion
@@ -27,35 +50,18 @@ async def analyze_complete(
     Returns:
         Combined analysis with final verdict
     """
-    # Import analysis stores from endpoints
-    from app.api.v1.endpoints import text, audio, video
-    
-    # Collect results from each modality
-    text_result = None
-    audio_result = None
-    video_result = None
+    # Parse the fusion strategy before awaiting anything
+    strategy_enum = _STRATEGY_MAP.get(fusion_strategy, FusionStrategy.WEIGHTED_AVERAGE)
     
-    if text_analysis_id:
-        if text_analysis_id in text.analysis_store:
-            stored = text.analysis_store[text_analysis_id]
-            if stored['status'] == AnalysisStatus.COMPLETED:
-                text_result = stored.get('result_data')
-    
-    if audio_analysis_id:
-        if audio_analysis_id in audio.analysis_store:
-            stored = audio.analysis_store[audio_analysis_id]
-            if stored['status'] == AnalysisStatus.COMPLETED:
-                # Audio results are structured differently
-                text_result = {
-                    'quality': stored.get('quality', {}),
-                    'deepfake_detection': stored.get('deepfake_detection', {}),
-                }
-    
-    if video_analysis_id:
-        if video_analysis_id in video.analysis_store:
-            stored = video.analysis_store[video_analysis_id]
-            if stored['status'] == AnalysisStatus.COMPLETED:
-                video_result = stored.get('result', {})
+    # Fetch all three results in one round of concurrent requests on the
+    # shared connection pool instead of three sequential round-trips.
+    # Every modality stores its analysis under result_data, which is the
+    # shape the fusion engine's per-modality extractors expect
+    text_result, audio_result, video_result = await asyncio.gather(
+        _load_result(FileType.TEXT, text_analysis_id),
+        _load_result(FileType.AUDIO, audio_analysis_id),
+        _load_result(FileType.VIDEO, video_analysis_id),
+    )
     
     # Validate at least one result available
     if not any([text_result, audio_result, video_result]):
@@ -65,11 +71,6 @@ async def analyze_complete(
         )
     
     # Get fusion engine
-    try:
-        strategy_enum = FusionStrategy(fusion_strategy)
-    except ValueError:
-        strategy_enum = FusionStrategy.WEIGHTED_AVERAGE
-    
     fusion_engine = get_fusion_engine(strategy=strategy_enum)
     
     # Fuse results
@@ -79,43 +80,52 @@ async def analyze_complete(
         video_result=video_result
     )
     
-    return fused_result
+    # Serialize straight with orjson; returning the dict would first walk the
+    # whole payload (including every modality's result_data) through
+    # jsonable_encoder
+    return ORJSONResponse(fused_result)
+
+
+# Constant bodies, encoded once at import
+_STRATEGIES_BODY = orjson.dumps({
+    'strategies': [
+        {
+            'name': 'weighted_average',
+            'description': 'Weighted average of all modalities (recommended)',
+            'default': True
+        },
+        {
+            'name': 'maximum',
+            'description': 'Most optimistic score (highest credibility)',
+            'default': False
+        },
+        {
+            'name': 'minimum',
+            'description': 'Most pessimistic score (lowest credibility)',
+            'default': False
+        },
+        {
+            'name': 'voting',
+            'description': 'Majority voting across modalities',
+            'default': False
+        },
+    ]
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "complete-analysis",
+    "fusion_engine": "ready"
+})
 
 
 @router.get("/fusion-strategies")
-async def get_fusion_strategies():
+async def get_fusion_strategies() -> Response:
     """Get available fusion strategies"""
-    return {
-        'strategies': [
-            {
-                'name': 'weighted_average',
-                'description': 'Weighted average of all modalities (recommended)',
-                'default': True
-            },
-            {
-                'name': 'maximum',
-                'description': 'Most optimistic score (highest credibility)',
-                'default': False
-            },
-            {
-                'name': 'minimum',
-                'description': 'Most pessimistic score (lowest credibility)',
-                'default': False
-            },
-            {
-                'name': 'voting',
-                'description': 'Majority voting across modalities',
-                'default': False
-            },
-        ]
-    }
+    return Response(content=_STRATEGIES_BODY, media_type="application/json")
 
 
 @router.get("/health")
-async def complete_health():
+async def complete_health() -> Response:
     """Health check for complete analysis endpoint"""
-    return {
-        "status": "healthy",
-        "service": "complete-analysis",
-        "fusion_engine": "ready"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,120 +1,101 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-from typing import Dict, Any
+from fastapi import APIRouter, UploadFile, File, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
-import uuid
+import msgspec
+import orjson
 
 from app.services.file_handler import (
-    validate_file,
-    save_upload_file,
+    save_and_validate_upload,
     ALLOWED_TEXT_EXTENSIONS,
     MAX_TEXT_SIZE,
 )
-from app.services.text_processor import analyze_text_file
+from app.services.analysis_store import get_analysis_store
+from app.services.result_cache import get_cached_result, result_response
+from app.workers.tasks import process_text_analysis
 from app.schemas.analysis import (
     AnalysisResponse,
+    AnalysisResponseOut,
     AnalysisStatus,
     FileType,
-    TextAnalysisResult,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# In-memory storage for demo (will be replaced with database)
-analysis_store: Dict[str, Dict[str, Any]] = {}
+# Bound once to skip the enum attribute lookups per request
+_PROCESSING = AnalysisStatus.PROCESSING
+_FILE_TYPE = FileType.TEXT
 
 
-async def process_text_analysis(file_id: str, file_path: str):
-    """Background task to process text analysis"""
-    try:
-        # Perform analysis with ML
-        result = await analyze_text_file(file_path, use_ml=True)
-        
-        # Calculate fake news score
-        # Prioritize ML prediction if available, otherwise use rule-based
-        if result.get('ml_prediction'):
-            ml_pred = result['ml_prediction']
-            # Convert fake probability to credibility score (inverse)
-            fake_prob = ml_pred.get('fake_probability', 0.5)
-            score = (1 - fake_prob) * 100  # 0% fake = 100% credible
-            confidence = ml_pred.get('confidence', 0.5)
-        else:
-            # Fallback to rule-based scoring
-            manipulation_count = len(result['manipulation_indicators'])
-            base_score = 100 - (manipulation_count * 15)
-            score = max(10, min(100, base_score))
-            confidence = 0.6
-        
-        # Store result
-        analysis_store[file_id] = {
-            'status': AnalysisStatus.COMPLETED,
-            'completed_at': datetime.now(),
-            'credibility_score': score,
-            'confidence': confidence,
-            'result_data': result,
-        }
-    except Exception as e:
-        analysis_store[file_id] = {
-            'status': AnalysisStatus.FAILED,
-            'completed_at': datetime.now(),
-            'error': str(e),
-        }
-
-
-@router.post("/analyze", response_model=AnalysisResponse)
+@router.post(
+    "/analyze",
+    response_model=None,
+    responses={200: {"model": AnalysisResponse}},
+)
 async def analyze_text(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...)
-) -> AnalysisResponse:
+) -> Response:
     """
     Analyze text content for fake news detection
     """
-    # Validate file
-    await validate_file(file, ALLOWED_TEXT_EXTENSIONS, MAX_TEXT_SIZE)
-    
-    # Save file
-    file_id, file_path, file_size = await save_upload_file(file, "text")
+    # Validate and save file
+    file_id, file_path, file_size = await save_and_validate_upload(
+        file, "text", ALLOWED_TEXT_EXTENSIONS, MAX_TEXT_SIZE
+    )
+    now = datetime.now()
     
     # Store initial analysis record
-    analysis_store[file_id] = {
-        'status': AnalysisStatus.PROCESSING,
-        'uploaded_at': datetime.now(),
-    }
+    await get_analysis_store().set(_FILE_TYPE, file_id, {
+        'status': _PROCESSING,
+        'uploaded_at': now,
+    })
     
-    # Trigger background analysis
-    background_tasks.add_task(process_text_analysis, file_id, file_path)
+    # Queue analysis on the worker fleet
+    process_text_analysis.send(file_id, file_path)
     
-    # Return immediate response
-    return AnalysisResponse(
+    # Return immediate response (server-built values, encoded without validation)
+    response = AnalysisResponseOut(
         id=file_id,
         filename=file.filename or "unknown",
-        file_type=FileType.TEXT,
+        file_type=_FILE_TYPE,
         file_size=file_size,
-        status=AnalysisStatus.PROCESSING,
-        uploaded_at=datetime.now(),
+        status=_PROCESSING,
+        uploaded_at=now,
     )
+    return Response(content=msgspec.json.encode(response), media_type="application/json")
 
 
 @router.get("/result/{analysis_id}", response_model=AnalysisResponse)
-async def get_text_result(analysis_id: str) -> AnalysisResponse:
+async def get_text_result(analysis_id: str) -> Response:
     """Get text analysis result"""
-    if analysis_id not in analysis_store:
+    cached = get_cached_result(_FILE_TYPE, analysis_id)
+    if cached is not None:
+        return cached
+    
+    stored = await get_analysis_store().get(_FILE_TYPE, analysis_id)
+    if stored is None:
         raise HTTPException(status_code=404, detail="Analysis not found")
     
-    stored = analysis_store[analysis_id]
-    return AnalysisResponse(
+    response = AnalysisResponse(
         id=analysis_id,
         filename="",  # Would come from DB
-        file_type=FileType.TEXT,
+        file_type=_FILE_TYPE,
         file_size=0,  # Would come from DB
         status=stored['status'],
-        uploaded_at=stored.get('uploaded_at', datetime.now()),
+        uploaded_at=stored.get('uploaded_at') or datetime.now(),
         completed_at=stored.get('completed_at'),
         credibility_score=stored.get('credibility_score'),
         confidence=stored.get('confidence'),
         result_data=stored.get('result_data'),
     )
+    
+    # Already validated above; skip the response_model round-trip
+    return result_response(response)
+
+
+# Constant body, encoded once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "text-analysis"})
 
 
 @router.get("/health")
-async def text_health():
-    return {"status": "healthy", "service": "text-analysis"}
+async def text_health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,6 +32,11 @@ class Settings(BaseSettings):
     def REDIS_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
     
+    # Analysis records
+    ANALYSIS_TTL_SECONDS: int = 24 * 60 * 60  # 24h
+    RESULT_CACHE_SIZE: int = 10_000
+    RESULT_CACHE_TTL_SECONDS: int = 60
+    
     # Security
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -43,6 +48,14 @@ class Settings(BaseSettings):
     
     # ML Models
     MODELS_DIR: str = "models"
+    TEXT_CLASSIFIER_MODEL: Optional[str] = None  # fine-tuned fake/real model; zero-shot BART if unset
+    TEXT_RESULT_CACHE_SIZE: int = 4096  # zero-shot outputs kept per process
+    WORKER_PRELOAD_MODELS: bool = True  # load models when a worker process boots
+    WORKER_PROCESSES: int = 4  # Dramatiq worker processes per machine (dramatiq -p)
+    WHISPER_BATCH_SIZE: int = 8  # audio chunks decoded together on GPU
+    WHISPER_IDLE_UNLOAD_SECONDS: Optional[int] = None  # free the model when idle
+    WHISPER_PRECISION: Optional[str] = None  # fp16/bf16/fp32, default picked per GPU
+    WHISPER_VAD_THRESHOLD: float = 0.5  # Silero speech probability for the VAD gate
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,33 @@
+"""Thread pool for per-frame OpenCV work"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+
+# Singleton instance
+_frame_pool: Optional[ThreadPoolExecutor] = None
+_frame_pool_lock = threading.Lock()
+
+
+def get_frame_pool() -> ThreadPoolExecutor:
+    """
+    Get or create the pool that analyzes video frames in parallel
+    
+    OpenCV releases the GIL, so threads suffice. There is one pool per
+    process, shared by every worker thread, and it is sized to the process's
+    share of the cores, so concurrent videos queue for threads instead of
+    oversubscribing the CPU.
+    """
+    global _frame_pool
+    
+    if _frame_pool is None:
+        with _frame_pool_lock:
+            if _frame_pool is None:
+                _frame_pool = ThreadPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 1) // settings.WORKER_PROCESSES),
+                    thread_name_prefix="video-frames",
+                )
+    
+    return _frame_pool
@@ -1,13 +1,28 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.services.analysis_store import get_analysis_store, close_analysis_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared Redis pool once per worker process
+    get_analysis_store()
+    yield
+    await close_analysis_store()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Multi-Modal Fake News Detection API",
     version="0.1.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Set up CORS
@@ -23,15 +38,20 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+# Constant bodies, encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Multi-Modal Fake News Detection API",
+    "version": "0.1.0",
+    "status": "active",
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/")
-async def root():
-    return {
-        "message": "Multi-Modal Fake News Detection API",
-        "version": "0.1.0",
-        "status": "active",
-    }
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+async def health_check() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1 +1,21 @@
 """Machine Learning models for fake news detection"""
+import os
+
+# Configure the CUDA caching allocator before any model module imports torch:
+# expandable segments stop the block fragmentation that variable-length
+# decoder loops (Whisper) otherwise build up
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+
+def set_gpu_memory_budget(processes: int):
+    """
+    Cap this process's PyTorch allocations at an equal share of the GPU
+    
+    The cap covers every model in the process; the worker processes on a
+    machine share the device, so together they stay within its memory.
+    Call once, before any model is loaded.
+    """
+    import torch
+    
+    if torch.cuda.is_available():
+        torch.cuda.set_per_process_memory_fraction(1 / max(1, processes))
@@ -1,23 +1,61 @@
 import torch
-import whisper
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
+import contextlib
+import fcntl
+import logging
+import os
+import threading
 import warnings
 
+from app.core.config import settings
+
+# Transcription backends (faster-whisper preferred, openai-whisper as fallback)
+try:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+except ImportError:
+    BatchedInferencePipeline = None
+    WhisperModel = None
+    decode_audio = None
+
+try:
+    import whisper
+except ImportError:
+    whisper = None
+
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# The Whisper encoder always sees a fixed 30s mel window, so cudnn's
+# per-shape algorithm search runs once and is reused; TF32 covers fp32 GEMMs
+torch.backends.cudnn.benchmark = True
+torch.backends.cuda.matmul.allow_tf32 = True
+
+# Whisper works on 16 kHz mono audio, decoded in 30s windows
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+
 
 class WhisperTranscriber:
     """
-    Audio transcription using OpenAI's Whisper model
+    Audio transcription using Whisper
+    
+    Runs on faster-whisper (CTranslate2, int8/fp16 kernels) when installed,
+    otherwise on the reference openai-whisper PyTorch model.
     """
     
     def __init__(
         self,
         model_size: str = "base",
         device: Optional[str] = None,
-        language: str = "en"
+        language: str = "en",
+        backend: Optional[str] = None,
+        download_root: Optional[str] = None,
+        precision: Optional[str] = None
     ):
         """
         Initialize Whisper transcriber
@@ -26,9 +64,15 @@ class WhisperTranscriber:
             model_size: Model size - tiny, base, small, medium, large
             device: Device to run on (cuda/cpu)
             language: Language code for transcription
+            backend: 'faster-whisper' or 'openai' (default: best available)
+            download_root: Weight cache directory (default: MODELS_DIR/whisper)
+            precision: 'fp16', 'bf16' or 'fp32' activations (default: bf16
+                on Hopper, fp16 on other GPUs, fp32 on CPU)
         """
         self.model_size = model_size
         self.language = language
+        # Persistent (volume-mounted) cache so restarts never re-download
+        self.download_root = download_root or str(Path(settings.MODELS_DIR) / "whisper")
         
         # Determine device
         if device is None:
@@ -36,22 +80,170 @@ class WhisperTranscriber:
         else:
             self.device = device
         
-        print(f"Loading Whisper model '{model_size}' on device: {self.device}")
+        # Determine precision (bf16's wider range avoids fp16 overflow on Hopper)
+        if precision is None:
+            precision = settings.WHISPER_PRECISION
+        if self.device != "cuda":
+            self.precision = "fp32"
+        elif precision is None:
+            self.precision = "bf16" if torch.cuda.get_device_capability() >= (9, 0) else "fp16"
+        else:
+            self.precision = precision
+        
+        # Determine backend
+        if backend is None:
+            self.backend = "faster-whisper" if WhisperModel is not None else "openai"
+        else:
+            self.backend = backend
         
+        # The model is loaded on the first transcribe() call, and can be
+        # released again after WHISPER_IDLE_UNLOAD_SECONDS without requests
         self.model = None
-        self._load_model()
+        self.pipeline = None
+        self._load_failed = False
+        self._active_calls = 0
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+    
+    def _compute_type(self) -> str:
+        """Pick the CTranslate2 compute type for the current device"""
+        if self.device != "cuda":
+            return "int8"
+        if self.precision == "bf16":
+            return "int8_bfloat16"
+        if self.precision == "fp32":
+            return "int8_float32"
+        # Tensor cores (Volta+) run int8 GEMMs with fp16 activations
+        if torch.cuda.get_device_capability() >= (7, 0):
+            return "int8_float16"
+        return "float16"
     
     def _load_model(self):
         """Load Whisper model"""
+        logger.info(
+            "Loading Whisper model '%s' (%s) on device: %s",
+            self.model_size, self.backend, self.device
+        )
+        
         try:
-            self.model = whisper.load_model(
-                self.model_size,
+            if self.backend == "faster-whisper":
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self._compute_type(),
+                    download_root=self.download_root
+                )
+                # On GPU, decode the VAD-split chunks of a file as batches
+                # instead of one 30s window at a time
+                if self.device == "cuda":
+                    self.pipeline = BatchedInferencePipeline(model=self.model)
+            else:
+                self.model = self._load_openai_model()
+                if self.precision == "fp16":
+                    self._half_model()
+                # mel_filters is lru_cached per (torch.device, n_mels). Warm
+                # it with the device of the waveform _transcribe_openai hands
+                # Whisper (cuda:0 or cpu), not the "cuda"/"cpu" string, which
+                # is a different cache key
+                mel_device = torch.empty(0, device=self.device).device
+                whisper.audio.mel_filters(mel_device, self.model.dims.n_mels)
+                if self.device == "cuda":
+                    self._compile_encoder()
+            logger.info("Whisper model loaded successfully")
+        except Exception:
+            logger.error("Error loading Whisper model", exc_info=True)
+            self.model = None
+    
+    def _snapshot_path(self) -> Path:
+        """Snapshot file, keyed so torch upgrades or a new GPU never reuse it"""
+        if self.device == "cuda":
+            major, minor = torch.cuda.get_device_capability()
+            target = f"sm{major}{minor}"
+        else:
+            target = "cpu"
+        name = f"{self.model_size}-torch{torch.__version__}-{target}.pt"
+        return Path(self.download_root) / "snapshots" / name
+    
+    def _load_openai_model(self):
+        """
+        Load the openai-whisper model from a torch.save snapshot
+        
+        The first start builds the model with whisper.load_model and saves it;
+        later starts skip config parsing, module construction and
+        load_state_dict. An exclusive flock makes concurrent starts wait for
+        the one writing the snapshot.
+        """
+        snapshot = self._snapshot_path()
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(snapshot.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if snapshot.exists():
+                    return torch.load(snapshot, map_location=self.device, weights_only=False)
+                
+                model = whisper.load_model(
+                    self.model_size,
+                    device=self.device,
+                    download_root=self.download_root
+                )
+                # Write then rename so a crash never leaves a truncated snapshot
+                tmp_path = snapshot.with_suffix(".tmp")
+                torch.save(model, tmp_path)
+                os.replace(tmp_path, snapshot)
+                return model
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _half_model(self):
+        """
+        Store the openai-whisper weights in fp16
+        
+        Whisper's layers cast fp32 weights to the activation dtype on every
+        forward; half weights skip those casts and halve weight traffic.
+        LayerNorms stay fp32 because Whisper runs them on fp32 inputs.
+        """
+        self.model.half()
+        for module in self.model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+    
+    def _autocast(self):
+        """bf16 autocast for openai-whisper (it only feeds fp16 or fp32 mels)"""
+        if self.precision == "bf16":
+            return torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+    
+    def _compile_encoder(self):
+        """
+        torch.compile the openai-whisper encoder (CUDA only)
+        
+        The encoder always sees a fixed 30s mel window, so it compiles for a
+        single shape. The decoder is left eager: its kv-cache hooks and
+        growing sequence length would force constant recompilation.
+        
+        CUDA graphs ("reduce-overhead") are not used: the model is shared by
+        the worker threads, and graph replays reuse static output buffers and
+        per-thread graph state that concurrent calls would race on.
+        """
+        # Persist Inductor kernels next to the weights so restarts reuse them
+        os.environ.setdefault(
+            "TORCHINDUCTOR_CACHE_DIR", str(Path(self.download_root) / "inductor")
+        )
+        eager_encoder = self.model.encoder
+        try:
+            self.model.encoder = torch.compile(eager_encoder)
+            # Compile now, with the mel dtype transcribe uses, rather than on a request
+            warmup_mel = torch.zeros(
+                1, self.model.dims.n_mels, 3000,
+                dtype=torch.float16 if self.precision == "fp16" else torch.float32,
                 device=self.device
             )
-            print(f"✓ Whisper model loaded successfully")
+            with torch.no_grad(), self._autocast():
+                self.model.encoder(warmup_mel)
         except Exception as e:
-            print(f"Error loading Whisper model: {e}")
-            self.model = None
+            logger.warning("torch.compile failed, using eager Whisper encoder: %s", e)
+            self.model.encoder = eager_encoder
     
     def transcribe(
         self,
@@ -74,45 +266,240 @@ class WhisperTranscriber:
                 - language: Detected language
                 - confidence: Average confidence score
         """
-        if self.model is None:
-            return self._fallback_transcription()
+        # Silence, music or noise never reaches the model (nor loads it)
+        audio = self._speech_audio(audio_path)
+        if audio is not None and not audio[1]:
+            return self._no_speech_transcription()
         
+        self._begin_call()
         try:
-            # Transcribe
-            result = self.model.transcribe(
-                audio_path,
-                language=self.language if self.language else None,
-                word_timestamps=return_timestamps,
-                verbose=False
-            )
+            if self.model is None:
+                return self._fallback_transcription()
             
-            # Extract segments
-            segments = []
-            if 'segments' in result:
-                for seg in result['segments']:
-                    segments.append({
-                        'start': seg.get('start', 0),
-                        'end': seg.get('end', 0),
-                        'text': seg.get('text', '').strip(),
-                        'confidence': seg.get('no_speech_prob', 0),
-                    })
+            # Transcribe (from the decoded audio when the VAD gate ran)
+            if self.backend == "faster-whisper":
+                if audio is not None:
+                    samples, speech = audio
+                    text, segments, language = self._transcribe_faster_whisper(
+                        samples, self._speech_clips(speech), return_timestamps
+                    )
+                else:
+                    text, segments, language = self._transcribe_faster_whisper(
+                        audio_path, None, return_timestamps
+                    )
+            elif audio is not None:
+                # Trim leading/trailing non-speech, so the encoder sees fewer
+                # 30s windows, then shift timestamps back to the original clip
+                samples, speech = audio
+                start, end = speech[0]['start'], speech[-1]['end']
+                text, segments, language = self._transcribe_openai(
+                    samples[start:end], return_timestamps
+                )
+                offset = start / SAMPLE_RATE
+                for seg in segments:
+                    seg['start'] += offset
+                    seg['end'] += offset
+            else:
+                text, segments, language = self._transcribe_openai(
+                    audio_path, return_timestamps
+                )
             
-            # Calculate average confidence
+            # Calculate average confidence (one pass, no list or array)
             if segments:
-                avg_confidence = 1 - np.mean([s['confidence'] for s in segments])
+                avg_confidence = 1 - sum(s['confidence'] for s in segments) / len(segments)
             else:
                 avg_confidence = 0.5
             
             return {
-                'text': result.get('text', '').strip(),
+                'text': text,
                 'segments': segments,
-                'language': result.get('language', 'unknown'),
+                'language': language,
                 'confidence': float(avg_confidence),
             }
-            
-        except Exception as e:
-            print(f"Error transcribing audio: {e}")
+        
+        except Exception:
+            logger.error("Error transcribing audio", exc_info=True)
             return self._fallback_transcription()
+        finally:
+            self._end_call()
+    
+    def _speech_audio(
+        self,
+        audio_path: str
+    ) -> Optional[Tuple[np.ndarray, List[Dict[str, int]]]]:
+        """
+        Decode the file and run Silero VAD over it
+        
+        Returns (samples, speech spans in samples), with no spans when no
+        speech was found, or None when the VAD (shipped with faster-whisper)
+        is unavailable or fails. The options are the ones
+        BatchedInferencePipeline uses for its own VAD, so spans never exceed
+        one Whisper window.
+        """
+        if decode_audio is None:
+            return None
+        try:
+            samples = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+            speech = get_speech_timestamps(
+                samples,
+                VadOptions(
+                    threshold=settings.WHISPER_VAD_THRESHOLD,
+                    max_speech_duration_s=WINDOW_SECONDS,
+                    min_silence_duration_ms=160
+                ),
+                sampling_rate=SAMPLE_RATE
+            )
+        except Exception as e:
+            logger.warning("VAD gate skipped: %s", e)
+            return None
+        return samples, speech
+    
+    def _speech_clips(self, speech: List[Dict[str, int]]) -> List[Tuple[float, float]]:
+        """Group consecutive speech spans into clips of at most one window (seconds)"""
+        clips = []
+        for span in speech:
+            start, end = span['start'] / SAMPLE_RATE, span['end'] / SAMPLE_RATE
+            if clips and end - clips[-1][0] <= WINDOW_SECONDS:
+                clips[-1] = (clips[-1][0], end)
+            else:
+                clips.append((start, end))
+        return clips
+    
+    def warm_up(self):
+        """Load the model now instead of on the first transcription"""
+        self._begin_call()
+        self._end_call()
+    
+    def _begin_call(self):
+        """Load the model on first use and mark a transcription in flight"""
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            # A failed load is not retried on every call (same as eager loading)
+            if self.model is None and not self._load_failed:
+                self._load_model()
+                self._load_failed = self.model is None
+            self._active_calls += 1
+    
+    def _end_call(self):
+        """Mark a transcription finished and arm the idle unload timer"""
+        with self._lock:
+            self._active_calls -= 1
+            timeout = settings.WHISPER_IDLE_UNLOAD_SECONDS
+            if self._active_calls == 0 and timeout and self.model is not None:
+                self._idle_timer = threading.Timer(timeout, self._unload_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+    
+    def _unload_if_idle(self):
+        with self._lock:
+            if self._active_calls == 0:
+                self.unload()
+    
+    def _transcribe_faster_whisper(
+        self,
+        audio: Union[str, np.ndarray],
+        clips: Optional[List[Tuple[float, float]]],
+        return_timestamps: bool
+    ) -> Tuple[str, List[Dict[str, Any]], str]:
+        """
+        Transcribe with faster-whisper; returns (text, segments, language)
+        
+        Only the VAD gate's speech clips are decoded, when it ran, instead of
+        Silero running again inside faster-whisper (vad_filter); timestamps
+        stay relative to the whole file either way.
+        """
+        if clips is None:
+            speech = {'vad_filter': True}
+        elif self.pipeline is not None:
+            # In seconds: faster-whisper >= 1.2 converts them to samples
+            speech = {'clip_timestamps': [{'start': s, 'end': e} for s, e in clips]}
+        else:
+            speech = {'clip_timestamps': [t for clip in clips for t in clip]}
+        
+        if self.pipeline is not None:
+            seg_iter, info = self.pipeline.transcribe(
+                audio,
+                language=self.language if self.language else None,
+                word_timestamps=return_timestamps,
+                batch_size=settings.WHISPER_BATCH_SIZE,
+                **speech
+            )
+        else:
+            seg_iter, info = self.model.transcribe(
+                audio,
+                language=self.language if self.language else None,
+                word_timestamps=return_timestamps,
+                **speech
+            )
+        
+        # Segments are generated lazily as decoding proceeds
+        texts = []
+        segments = []
+        for seg in seg_iter:
+            texts.append(seg.text)
+            segments.append({
+                'start': seg.start,
+                'end': seg.end,
+                'text': seg.text.strip(),
+                'confidence': seg.no_speech_prob,
+            })
+        
+        return ''.join(texts).strip(), segments, info.language or 'unknown'
+    
+    def _transcribe_openai(
+        self,
+        audio: Union[str, np.ndarray],
+        return_timestamps: bool
+    ) -> Tuple[str, List[Dict[str, Any]], str]:
+        """Transcribe with openai-whisper; returns (text, segments, language)"""
+        # Hand Whisper the waveform on the GPU so its log-mel (torch.stft and
+        # the mel projection) runs there instead of on the CPU plus a copy
+        if self.device == "cuda":
+            if isinstance(audio, str):
+                audio = whisper.audio.load_audio(audio)
+            audio = torch.from_numpy(audio).to(self.device)
+        
+        with torch.inference_mode(), self._autocast():
+            result = self.model.transcribe(
+                audio,
+                language=self.language if self.language else None,
+                word_timestamps=return_timestamps,
+                fp16=self.precision == "fp16",
+                verbose=False
+            )
+        
+        # Extract segments
+        segments = []
+        if 'segments' in result:
+            for seg in result['segments']:
+                segments.append({
+                    'start': seg.get('start', 0),
+                    'end': seg.get('end', 0),
+                    'text': seg.get('text', '').strip(),
+                    'confidence': seg.get('no_speech_prob', 0),
+                })
+        
+        return result.get('text', '').strip(), segments, result.get('language', 'unknown')
+    
+    def unload(self):
+        """Release the model and return its cached GPU memory (reloads on next use)"""
+        self.model = None
+        self.pipeline = None
+        self._load_failed = False
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+    
+    def _no_speech_transcription(self) -> Dict[str, Any]:
+        """Result for audio in which the VAD gate found no speech"""
+        return {
+            'text': '',
+            'segments': [],
+            'language': 'unknown',
+            'confidence': 0.0,
+            'method': 'vad-gate',
+        }
     
     def _fallback_transcription(self) -> Dict[str, Any]:
         """Fallback when model unavailable"""
@@ -124,6 +511,46 @@ class WhisperTranscriber:
         }
 
 
+# Deepfake heuristics as a rule table. A rule fires when its value lies
+# outside [lo, hi] but inside [outer_lo, outer_hi]; the outer band keeps a
+# mild tier from firing alongside the severe tier of the same feature.
+# At most one rule fires per feature, in this (reporting) order.
+_RULES = np.array([
+    # Human speech typically 500-2000 Hz; AI voices often have anomalies
+    ('features', 'spectral_centroid_mean', 250, 3500, -np.inf, np.inf, 0.20, "Extreme spectral centroid anomaly"),
+    ('features', 'spectral_centroid_mean', 300, 3000, 250, 3500, 0.12, "Unusual spectral centroid"),
+    # Natural speech: 0.01 - 0.2; AI synthesis often deviates
+    ('features', 'zero_crossing_rate_mean', 0.003, 0.4, -np.inf, np.inf, 0.18, "Severe zero-crossing rate anomaly"),
+    ('features', 'zero_crossing_rate_mean', 0.005, 0.3, 0.003, 0.4, 0.10, "Unusual zero-crossing rate"),
+    # Audio artifacts (flag stored as 0/1)
+    ('quality', 'clipping_detected', -np.inf, 0.5, -np.inf, np.inf, 0.10, "Audio clipping detected"),
+    # Low SNR, or unrealistically high SNR (too clean)
+    ('quality', 'snr_db', 8, np.inf, -np.inf, np.inf, 0.15, "Very low signal-to-noise ratio"),
+    ('quality', 'snr_db', 10, np.inf, 8, np.inf, 0.08, "Low signal-to-noise ratio"),
+    ('quality', 'snr_db', -np.inf, 55, -np.inf, np.inf, 0.18, "Unrealistically high SNR (possibly synthetic)"),
+    ('quality', 'snr_db', -np.inf, 50, -np.inf, 55, 0.12, "Unusually high SNR"),
+    # Very low MFCC variance indicates lack of natural voice variation
+    ('features', 'mfcc_std', 3, np.inf, -np.inf, np.inf, 0.20, "Extremely low MFCC variance (synthetic indicator)"),
+    ('features', 'mfcc_std', 5, np.inf, 3, np.inf, 0.12, "Low MFCC variance"),
+    ('features', 'formant_consistency', 0.6, np.inf, -np.inf, np.inf, 0.15, "Poor formant consistency"),
+    # Heavily compressed/processed audio
+    ('quality', 'dynamic_range_db', 8, np.inf, -np.inf, np.inf, 0.12, "Very low dynamic range"),
+    ('quality', 'dynamic_range_db', 10, np.inf, 8, np.inf, 0.08, "Low dynamic range"),
+], dtype=[
+    ('source', 'U8'), ('key', 'U32'),
+    ('lo', 'f8'), ('hi', 'f8'), ('outer_lo', 'f8'), ('outer_hi', 'f8'),
+    ('penalty', 'f8'), ('message', 'U64'),
+])
+# source -> input key -> rows of _RULES reading it, so each input present
+# in the call is looked up once however many tiers use it
+_RULE_ROWS: Dict[str, Dict[str, np.ndarray]] = {}
+for _row, (_source, _key) in enumerate(zip(_RULES['source'].tolist(), _RULES['key'].tolist())):
+    _RULE_ROWS.setdefault(_source, {}).setdefault(_key, []).append(_row)
+for _rows in _RULE_ROWS.values():
+    for _key in _rows:
+        _rows[_key] = np.array(_rows[_key])
+
+
 class AudioDeepfakeDetector:
     """
     Audio deepfake detection using signal analysis
@@ -143,7 +570,7 @@ class AudioDeepfakeDetector:
         else:
             self.device = device
         
-        print(f"Audio deepfake detector initialized on: {self.device}")
+        logger.info("Audio deepfake detector initialized on: %s", self.device)
     
     def detect(
         self,
@@ -164,80 +591,22 @@ class AudioDeepfakeDetector:
                 - authenticity_score: Score 0-100
                 - indicators: List of suspicious indicators
         """
-        indicators = []
-        suspicion_score = 0.0
-        
-        # Enhanced spectral analysis for synthetic voice detection
-        if 'spectral_centroid_mean' in audio_features:
-            centroid = audio_features['spectral_centroid_mean']
-            # Human speech typically 500-2000 Hz; AI voices often have anomalies
-            if centroid < 250 or centroid > 3500:
-                indicators.append("Extreme spectral centroid anomaly")
-                suspicion_score += 0.20
-            elif centroid < 300 or centroid > 3000:
-                indicators.append("Unusual spectral centroid")
-                suspicion_score += 0.12
-        
-        # Enhanced zero-crossing rate analysis
-        if 'zero_crossing_rate_mean' in audio_features:
-            zcr = audio_features['zero_crossing_rate_mean']
-            # Natural speech: 0.01 - 0.2; AI synthesis often deviates
-            if zcr < 0.003 or zcr > 0.4:
-                indicators.append("Severe zero-crossing rate anomaly")
-                suspicion_score += 0.18
-            elif zcr < 0.005 or zcr > 0.3:
-                indicators.append("Unusual zero-crossing rate")
-                suspicion_score += 0.10
-        
-        # Check for audio artifacts
-        if 'clipping_detected' in audio_quality:
-            if audio_quality['clipping_detected']:
-                indicators.append("Audio clipping detected")
-                suspicion_score += 0.1
+        # Fill rule inputs from the keys actually present (missing -> NaN,
+        # which never flags)
+        values = np.full(len(_RULES), np.nan)
+        for source, inputs in (('features', audio_features), ('quality', audio_quality)):
+            rows = _RULE_ROWS[source]
+            for key in rows.keys() & inputs.keys():
+                values[rows[key]] = float(inputs[key])
         
-        # Enhanced SNR analysis
-        if 'snr_db' in audio_quality:
-            snr = audio_quality['snr_db']
-            if snr < 8:  # Very low SNR
-                indicators.append("Very low signal-to-noise ratio")
-                suspicion_score += 0.15
-            elif snr < 10:
-                indicators.append("Low signal-to-noise ratio")
-                suspicion_score += 0.08
-            elif snr > 55:  # Unrealistically high SNR (too clean)
-                indicators.append("Unrealistically high SNR (possibly synthetic)")
-                suspicion_score += 0.18
-            elif snr > 50:
-                indicators.append("Unusually high SNR")
-                suspicion_score += 0.12
-        
-        # Enhanced MFCC analysis for voice authenticity
-        if 'mfcc_std' in audio_features:
-            mfcc_std = audio_features['mfcc_std']
-            # Very low variance indicates lack of natural voice variation
-            if mfcc_std < 3:
-                indicators.append("Extremely low MFCC variance (synthetic indicator)")
-                suspicion_score += 0.20
-            elif mfcc_std < 5:
-                indicators.append("Low MFCC variance")
-                suspicion_score += 0.12
-        
-        # Check formant frequencies if available
-        if 'formant_consistency' in audio_features:
-            consistency = audio_features['formant_consistency']
-            if consistency < 0.6:
-                indicators.append("Poor formant consistency")
-                suspicion_score += 0.15
-        
-        # Check dynamic range
-        if 'dynamic_range_db' in audio_quality:
-            dr = audio_quality['dynamic_range_db']
-            if dr < 8:  # Heavily compressed/processed
-                indicators.append("Very low dynamic range")
-                suspicion_score += 0.12
-            elif dr < 10:
-                indicators.append("Low dynamic range")
-                suspicion_score += 0.08
+        # Outside [lo, hi] but inside the outer band (see _RULES)
+        flagged = (
+            ((values < _RULES['lo']) | (values > _RULES['hi']))
+            & (values >= _RULES['outer_lo'])
+            & (values <= _RULES['outer_hi'])
+        )
+        indicators = _RULES['message'][flagged].tolist()
+        suspicion_score = float(_RULES['penalty'][flagged].sum())
         
         # Calculate final scores with better calibration
         suspicion_score = min(suspicion_score, 1.0)
@@ -262,17 +631,29 @@ class AudioDeepfakeDetector:
 # Singleton instances
 _whisper_instance = None
 _deepfake_detector_instance = None
+_whisper_lock = threading.Lock()
+_detector_lock = threading.Lock()
 
 
 def get_whisper_transcriber(
     model_size: str = "base",
     force_reload: bool = False
 ) -> WhisperTranscriber:
-    """Get or create Whisper transcriber instance"""
+    """Get or create Whisper transcriber instance (thread-safe)"""
     global _whisper_instance
     
-    if _whisper_instance is None or force_reload:
-        _whisper_instance = WhisperTranscriber(model_size=model_size)
+    # Fast path without the lock once loaded
+    if _whisper_instance is not None and not force_reload:
+        return _whisper_instance
+    
+    with _whisper_lock:
+        if force_reload and _whisper_instance is not None:
+            # Free the old weights first so a reload never holds two copies
+            _whisper_instance.unload()
+            _whisper_instance = None
+        
+        if _whisper_instance is None:
+            _whisper_instance = WhisperTranscriber(model_size=model_size)
     
     return _whisper_instance
 
@@ -280,10 +661,14 @@ def get_whisper_transcriber(
 def get_audio_deepfake_detector(
     force_reload: bool = False
 ) -> AudioDeepfakeDetector:
-    """Get or create audio deepfake detector instance"""
+    """Get or create audio deepfake detector instance (thread-safe)"""
     global _deepfake_detector_instance
     
-    if _deepfake_detector_instance is None or force_reload:
-        _deepfake_detector_instance = AudioDeepfakeDetector()
+    if _deepfake_detector_instance is not None and not force_reload:
+        return _deepfake_detector_instance
+    
+    with _detector_lock:
+        if _deepfake_detector_instance is None or force_reload:
+            _deepfake_detector_instance = AudioDeepfakeDetector()
     
     return _deepfake_detector_instance
@@ -1,7 +1,9 @@
 """Multi-modal fusion engine for combining text, audio, and video analysis"""
-import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 
 
 class ModalityType(str, Enum):
@@ -20,6 +22,29 @@ class FusionStrategy(str, Enum):
     LEARNED = "learned"  # For future ML-based fusion
 
 
+# Response keys for modality_contributions, stringified once
+MODALITY_KEYS = {modality: str(modality) for modality in ModalityType}
+
+# Confidence >= each threshold moves up one level
+CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+CONFIDENCE_LEVELS = ("Low", "Medium", "High", "Very High")
+
+# Indexed by (score > 30) + (score >= 70)
+SCORE_VERDICTS = ("FAKE", "UNCERTAIN", "REAL")
+
+
+def _count_indicators(indicators: List[str]) -> Tuple[int, int]:
+    """Count severe/extreme and edge-artifact indicators in one pass"""
+    severe_count = edge_count = 0
+    for indicator in indicators:
+        lowered = indicator.lower()
+        if 'severe' in lowered or 'extreme' in lowered:
+            severe_count += 1
+        if 'edge' in lowered:
+            edge_count += 1
+    return severe_count, edge_count
+
+
 class MultiModalFusionEngine:
     """
     Fuses predictions from multiple modalities for final verdict
@@ -54,9 +79,17 @@ class MultiModalFusionEngine:
         
         # Validate weights sum to 1.0
         weight_sum = sum(self.weights.values())
-        if not np.isclose(weight_sum, 1.0):
+        if abs(weight_sum - 1.0) > 1e-5:  # np.isclose tolerance
             # Normalize weights
             self.weights = {k: v/weight_sum for k, v in self.weights.items()}
+        
+        # Per-modality weights in fuse() order, and their sum for the common
+        # all-modalities case, resolved once instead of on every fusion
+        self._modality_weights = tuple(
+            (modality, self.weights.get(modality, 0.33))
+            for modality in (ModalityType.TEXT, ModalityType.AUDIO, ModalityType.VIDEO)
+        )
+        self._full_weight_sum = sum(weight for _, weight in self._modality_weights)
     
     def fuse(
         self,
@@ -83,12 +116,13 @@ class MultiModalFusionEngine:
         """
         # Collect available modalities
         modalities = {}
-        if text_result:
-            modalities[ModalityType.TEXT] = self._extract_text_score(text_result)
-        if audio_result:
-            modalities[ModalityType.AUDIO] = self._extract_audio_score(audio_result)
-        if video_result:
-            modalities[ModalityType.VIDEO] = self._extract_video_score(video_result)
+        extractors = (self._extract_text_score, self._extract_audio_score, self._extract_video_score)
+        results = (text_result, audio_result, video_result)
+        for (modality, weight), extract, result in zip(self._modality_weights, extractors, results):
+            if result:
+                contribution = extract(result)
+                contribution['weight'] = weight
+                modalities[modality] = contribution
         
         if not modalities:
             return self._no_data_result()
@@ -113,12 +147,19 @@ class MultiModalFusionEngine:
             final_score, confidence, verdict, modalities
         )
         
+        # Verdict and explanation use full precision; the response carries
+        # rounded values (the UI shows one decimal) to keep the JSON short
         return {
-            'final_score': final_score,
+            'final_score': round(final_score, 2),
             'final_verdict': verdict,
-            'confidence': confidence,
+            'confidence': round(confidence, 3),
             'modality_contributions': {
-                str(k): v for k, v in modalities.items()
+                MODALITY_KEYS[k]: {
+                    'score': round(v['score'], 2),
+                    'confidence': round(v['confidence'], 3),
+                    'weight': round(v['weight'], 3),
+                }
+                for k, v in modalities.items()
             },
             'explanation': explanation,
             'detailed_analysis': {
@@ -140,26 +181,22 @@ class MultiModalFusionEngine:
             credibility = (1 - fake_prob) * 100
             confidence = ml.get('confidence', 0.5)
             
-            # Adjust confidence based on text features
+            # Adjust confidence based on text features (credibility is
+            # already <= 100, so clamping it unconditionally is a no-op)
             features = ml.get('features', {})
             if features.get('clickbait_indicators', 0) > 3:
                 confidence = min(confidence + 0.1, 0.95)
-            if features.get('credibility_markers', 0) > 2:
-                credibility = min(credibility + 5, 100)
+            credibility = min(credibility + 5 * (features.get('credibility_markers', 0) > 2), 100)
         else:
             # Fallback to manipulation-based score
             manipulation_count = len(text_result.get('manipulation_indicators', []))
             sentiment = text_result.get('sentiment_analysis', {})
             
-            # More sophisticated scoring
+            # More sophisticated scoring, plus a penalty for extreme
+            # sentiment (often indicates bias)
             base_credibility = 65
-            manipulation_penalty = manipulation_count * 12
-            
-            # Adjust for extreme sentiment (often indicates bias)
-            if sentiment:
-                compound = abs(sentiment.get('compound', 0))
-                if compound > 0.8:
-                    manipulation_penalty += 8
+            extreme_sentiment = bool(sentiment) and abs(sentiment.get('compound', 0)) > 0.8
+            manipulation_penalty = manipulation_count * 12 + 8 * extreme_sentiment
             
             credibility = max(10, base_credibility - manipulation_penalty)
             confidence = 0.55 + min(manipulation_count * 0.05, 0.25)
@@ -167,7 +204,6 @@ class MultiModalFusionEngine:
         return {
             'score': credibility,
             'confidence': confidence,
-            'weight': self.weights.get(ModalityType.TEXT, 0.33),
         }
     
     def _extract_audio_score(self, audio_result: Dict[str, Any]) -> Dict[str, float]:
@@ -179,8 +215,7 @@ class MultiModalFusionEngine:
             confidence = df.get('confidence', 0.5)
             
             # Boost confidence for severe indicators
-            indicators = df.get('indicators', [])
-            severe_count = sum(1 for i in indicators if 'severe' in i.lower() or 'extreme' in i.lower())
+            severe_count, _ = _count_indicators(df.get('indicators', []))
             if severe_count > 0:
                 confidence = min(confidence + (severe_count * 0.08), 0.92)
         else:
@@ -203,7 +238,6 @@ class MultiModalFusionEngine:
         return {
             'score': authenticity,
             'confidence': confidence,
-            'weight': self.weights.get(ModalityType.AUDIO, 0.33),
         }
     
     def _extract_video_score(self, video_result: Dict[str, Any]) -> Dict[str, float]:
@@ -215,9 +249,7 @@ class MultiModalFusionEngine:
             confidence = df.get('confidence', 0.5)
             
             # Enhance confidence based on indicators
-            indicators = df.get('indicators', [])
-            severe_count = sum(1 for i in indicators if 'severe' in i.lower() or 'extreme' in i.lower())
-            edge_artifacts = sum(1 for i in indicators if 'edge' in i.lower())
+            severe_count, edge_artifacts = _count_indicators(df.get('indicators', []))
             
             if severe_count > 0:
                 confidence = min(confidence + (severe_count * 0.07), 0.88)
@@ -241,7 +273,6 @@ class MultiModalFusionEngine:
         return {
             'score': authenticity,
             'confidence': confidence,
-            'weight': self.weights.get(ModalityType.VIDEO, 0.33),
         }
     
     def _weighted_average_fusion(
@@ -249,27 +280,27 @@ class MultiModalFusionEngine:
         modalities: Dict[ModalityType, Dict[str, float]]
     ) -> Tuple[float, float]:
         """Enhanced weighted average fusion with cross-modal consistency"""
-        # Normalize weights for available modalities
-        available_weight_sum = sum(
-            m['weight'] for m in modalities.values()
-        )
+        # At most three modalities: plain float arithmetic beats building
+        # arrays and dispatching ufuncs
+        n = len(modalities)
+        score_sum = confidence_sum = 0.0
+        for m in modalities.values():
+            score_sum += m['score'] * m['weight']
+            confidence_sum += m['confidence'] * m['weight']
         
-        # Calculate weighted score
-        weighted_score = sum(
-            (m['score'] * m['weight']) / available_weight_sum
-            for m in modalities.values()
-        )
-        
-        # Calculate confidence (weighted by individual confidences)
-        weighted_confidence = sum(
-            (m['confidence'] * m['weight']) / available_weight_sum
-            for m in modalities.values()
-        )
+        # Normalize weights for available modalities
+        if n == len(self._modality_weights):
+            weight_sum = self._full_weight_sum
+        else:
+            weight_sum = sum(m['weight'] for m in modalities.values())
+        weighted_score = score_sum / weight_sum
+        weighted_confidence = confidence_sum / weight_sum
         
         # Cross-modal consistency bonus
-        if len(modalities) > 1:
+        if n > 1:
             scores = [m['score'] for m in modalities.values()]
-            score_std = np.std(scores)
+            mean = sum(scores) / n
+            score_std = (sum((x - mean) * (x - mean) for x in scores) / n) ** 0.5
             
             # If all modalities agree (low std), boost confidence
             if score_std < 15:
@@ -286,22 +317,17 @@ class MultiModalFusionEngine:
         modalities: Dict[ModalityType, Dict[str, float]]
     ) -> Tuple[float, float]:
         """Maximum fusion - most optimistic score"""
-        scores = [m['score'] for m in modalities.values()]
-        confidences = [m['confidence'] for m in modalities.values()]
-        
-        max_idx = np.argmax(scores)
-        return scores[max_idx], confidences[max_idx]
+        # Ties go to the first modality
+        best = max(modalities.values(), key=itemgetter('score'))
+        return best['score'], best['confidence']
     
     def _minimum_fusion(
         self,
         modalities: Dict[ModalityType, Dict[str, float]]
     ) -> Tuple[float, float]:
         """Minimum fusion - most pessimistic score"""
-        scores = [m['score'] for m in modalities.values()]
-        confidences = [m['confidence'] for m in modalities.values()]
-        
-        min_idx = np.argmin(scores)
-        return scores[min_idx], confidences[min_idx]
+        worst = min(modalities.values(), key=itemgetter('score'))
+        return worst['score'], worst['confidence']
     
     def _voting_fusion(
         self,
@@ -323,7 +349,7 @@ class MultiModalFusionEngine:
         else:
             final_score = 50.0  # Uncertain
         
-        avg_confidence = np.mean(confidences)
+        avg_confidence = sum(confidences) / len(confidences)
         return final_score, avg_confidence
     
     def _determine_verdict(self, score: float, confidence: float) -> str:
@@ -331,12 +357,7 @@ class MultiModalFusionEngine:
         if confidence < self.confidence_threshold:
             return "UNCERTAIN"
         
-        if score >= 70:
-            return "REAL"
-        elif score <= 30:
-            return "FAKE"
-        else:
-            return "UNCERTAIN"
+        return SCORE_VERDICTS[(score > 30) + (score >= 70)]
     
     def _build_explanation(
         self,
@@ -347,14 +368,7 @@ class MultiModalFusionEngine:
     ) -> Dict[str, Any]:
         """Build human-readable explanation"""
         # Determine confidence level
-        if confidence >= 0.8:
-            confidence_level = "Very High"
-        elif confidence >= 0.6:
-            confidence_level = "High"
-        elif confidence >= 0.4:
-            confidence_level = "Medium"
-        else:
-            confidence_level = "Low"
+        confidence_level = CONFIDENCE_LEVELS[bisect_right(CONFIDENCE_THRESHOLDS, confidence)]
         
         # Build summary
         summary = f"Overall Assessment: {verdict} (Score: {score:.1f}/100)\n"
@@ -401,8 +415,10 @@ class MultiModalFusionEngine:
         }
 
 
-# Singleton instance
-_fusion_engine_instance = None
+@lru_cache(maxsize=len(FusionStrategy))
+def _get_strategy_engine(strategy: FusionStrategy) -> MultiModalFusionEngine:
+    """One shared default-weight engine per strategy (engines are stateless)"""
+    return MultiModalFusionEngine(strategy=strategy)
 
 
 def get_fusion_engine(
@@ -410,13 +426,12 @@ def get_fusion_engine(
     weights: Optional[Dict[str, float]] = None,
     force_reload: bool = False
 ) -> MultiModalFusionEngine:
-    """Get or create fusion engine instance"""
-    global _fusion_engine_instance
+    """Get or create fusion engine instance for a strategy"""
+    # Custom weights are caller-specific, so they are never shared
+    if weights is not None:
+        return MultiModalFusionEngine(strategy=strategy, weights=weights)
     
-    if _fusion_engine_instance is None or force_reload:
-        _fusion_engine_instance = MultiModalFusionEngine(
-            strategy=strategy,
-            weights=weights
-        )
+    if force_reload:
+        _get_strategy_engine.cache_clear()
     
-    return _fusion_engine_instance
+    return _get_strategy_engine(strategy)
@@ -7,6 +7,117 @@ from transformers import (
 from typing import Dict, Any, List, Optional
 import numpy as np
 from pathlib import Path
+from bisect import bisect_left
+import threading
+from operator import itemgetter
+
+from cachetools import LRUCache
+
+from app.core.config import settings
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+ZERO_SHOT_MODEL = "facebook/bart-large-mnli"
+
+# Zero-shot labels; the first three count towards the fake probability
+CANDIDATE_LABELS = [
+    "fake news",
+    "misinformation",
+    "propaganda",
+    "factual news",
+    "reliable information"
+]
+FAKE_LABELS = frozenset(CANDIDATE_LABELS[:3])
+# NLI hypotheses, in the zero-shot pipeline's default template
+HYPOTHESES = [f"This example is {label}." for label in CANDIDATE_LABELS]
+# Token padding granularity, bounding the shapes the compiled model sees
+PAD_MULTIPLE = 64
+# Token limit for the fine-tuned classifier
+BINARY_MAX_LENGTH = 256
+
+# Confidence above each threshold moves up one level
+CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+CONFIDENCE_LEVELS = ("Low", "Medium", "High", "Very High")
+
+# Rule-based fallback phrase lists, with weights applied in _fallback_predictions
+CLICKBAIT_PHRASES = (
+    'you won\'t believe', 'shocking truth', 'doctors hate',
+    'one weird trick', 'what happened next', 'mind blowing',
+    'this is why', 'the real reason', 'they don\'t want'
+)
+
+EMOTIONAL_MANIPULATION = (
+    'outrageous', 'devastating', 'terrifying', 'horrifying',
+    'amazing', 'incredible', 'unbelievable', 'miracle',
+    'scandal', 'exposed', 'revealed', 'conspiracy'
+)
+
+URGENCY_WORDS = (
+    'breaking', 'urgent', 'alert', 'warning', 'must read',
+    'immediately', 'right now', 'before it\'s too late',
+    'limited time', 'act now', 'don\'t miss'
+)
+
+CREDIBILITY_INDICATORS = (
+    'study shows', 'research indicates', 'according to',
+    'expert', 'professor', 'dr.', 'ph.d.', 'university',
+    'institute', 'published', 'journal', 'peer-reviewed',
+    'data shows', 'statistics', 'evidence', 'analysis'
+)
+
+SOURCE_CITATIONS = (
+    'source:', 'via', 'according to', 'reported by',
+    'published in', 'study by', 'cited in'
+)
+
+PHRASE_CATEGORIES = (
+    CLICKBAIT_PHRASES,
+    EMOTIONAL_MANIPULATION,
+    URGENCY_WORDS,
+    CREDIBILITY_INDICATORS,
+    SOURCE_CITATIONS,
+)
+
+
+def _build_phrase_automaton():
+    """Aho-Corasick automaton mapping each phrase to the categories listing it"""
+    categories: Dict[str, List[int]] = {}
+    for category, phrases in enumerate(PHRASE_CATEGORIES):
+        for phrase in phrases:
+            categories.setdefault(phrase, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, phrase_categories in categories.items():
+        automaton.add_word(phrase, (phrase, tuple(phrase_categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+_phrase_automaton = _build_phrase_automaton() if ahocorasick is not None else None
+
+
+def _count_phrases(text_lower: str) -> List[int]:
+    """
+    Count the distinct phrases of each category present in the text
+    
+    One automaton pass finds every (overlapping) occurrence; a phrase counts
+    once per category however often it appears, as with ``phrase in text``.
+    """
+    if _phrase_automaton is None:
+        return [
+            sum(1 for phrase in phrases if phrase in text_lower)
+            for phrases in PHRASE_CATEGORIES
+        ]
+    
+    counts = [0] * len(PHRASE_CATEGORIES)
+    for _, phrase_categories in {match for _, match in _phrase_automaton.iter(text_lower)}:
+        for category in phrase_categories:
+            counts[category] += 1
+    return counts
 
 
 class TextFakeNewsDetector:
@@ -46,6 +157,11 @@ class TextFakeNewsDetector:
         self.model = None
         self.classifier = None
         
+        # Zero-shot outputs keyed by the (truncated) classifier input, so
+        # retried or duplicate articles skip the five NLI forward passes
+        self._result_cache = LRUCache(maxsize=settings.TEXT_RESULT_CACHE_SIZE)
+        self._result_cache_lock = threading.Lock()
+        
         self._load_model()
     
     def _load_model(self):
@@ -57,20 +173,135 @@ class TextFakeNewsDetector:
                 cache_dir=self.cache_dir
             )
             
-            # For demonstration, we'll use a zero-shot classification pipeline
-            # In production, replace with fine-tuned fake news detection model
+            # Half precision on GPU (bf16 from Ampere on, for its fp32 range)
+            if self.device != "cuda":
+                dtype = torch.float32
+            elif torch.cuda.is_bf16_supported():
+                dtype = torch.bfloat16
+            else:
+                dtype = torch.float16
+            
+            # A fine-tuned fake news classifier needs a single forward pass
+            if settings.TEXT_CLASSIFIER_MODEL:
+                self._load_binary_classifier(settings.TEXT_CLASSIFIER_MODEL, dtype)
+                print("✓ Model loaded successfully")
+                return
+            
+            # Otherwise, for demonstration, we'll use zero-shot classification
+            model = AutoModelForSequenceClassification.from_pretrained(
+                ZERO_SHOT_MODEL,
+                torch_dtype=dtype,
+                cache_dir=self.cache_dir
+            ).to(self.device)
+            model = self._prepare_model(model)
+            
             self.classifier = pipeline(
                 "zero-shot-classification",
-                model="facebook/bart-large-mnli",
+                model=model,
+                tokenizer=AutoTokenizer.from_pretrained(ZERO_SHOT_MODEL, cache_dir=self.cache_dir),
                 device=0 if self.device == "cuda" else -1
             )
             
+            # Logit columns compared for multi-label scores, as the pipeline does
+            label2id = {label.lower(): i for label, i in model.config.label2id.items()}
+            self._nli_label_ids = [label2id.get("contradiction", 0), label2id.get("entailment", 2)]
+            
+            self._inference_model = model
+            self._infer = self._zero_shot
+            self._model_used = 'zero-shot-bart'
+            if self.device == "cuda":
+                self._compile_model([self._encode_pairs(["warmup"])], dynamic=True)
+            
             print(f"✓ Model loaded successfully")
         except Exception as e:
             print(f"Error loading model: {e}")
             print("Will use fallback rule-based detection")
             self.classifier = None
     
+    def _load_binary_classifier(self, model_name: str, dtype: torch.dtype):
+        """Load a fine-tuned (real/fake) sequence classifier"""
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name,
+            torch_dtype=dtype,
+            cache_dir=self.cache_dir
+        ).to(self.device)
+        model = self._prepare_model(model)
+        
+        self.classifier = pipeline(
+            "text-classification",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(model_name, cache_dir=self.cache_dir),
+            device=0 if self.device == "cuda" else -1
+        )
+        
+        # Logit column of the fake class (label named like "fake", else 1)
+        fake_ids = [
+            i for label, i in model.config.label2id.items() if 'fake' in label.lower()
+        ]
+        self._fake_label_id = fake_ids[0] if fake_ids else 1
+        self._inference_model = model
+        self._infer = self._binary
+        self._model_used = 'fine-tuned-classifier'
+        if self.device == "cuda":
+            # Default mode, not CUDA graphs ("reduce-overhead"): this single
+            # instance is shared by the worker threads, and graph replays
+            # reuse static output buffers and per-thread graph state
+            self._compile_model([self._encode_texts(["warmup"])], dynamic=True)
+    
+    def _prepare_model(self, model):
+        """
+        Switch to eval mode; on CPU, also quantize Linear layers to int8
+        (dynamic quantization, served by the VNNI/AVX-512 int8 GEMMs)
+        """
+        model.eval()
+        if self.device == "cpu":
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        return model
+    
+    def _compile_model(self, warmup_batches: List[Dict[str, torch.Tensor]], **options):
+        """
+        torch.compile the loaded classifier (CUDA only)
+        
+        Inputs are padded to multiples of PAD_MULTIPLE tokens, so only a
+        handful of sequence lengths ever reach the compiled graph. options
+        go to torch.compile. Falls back to eager on failure.
+        """
+        model = self.classifier.model
+        try:
+            compiled = torch.compile(model, **options)
+            # Compile now rather than on the first request
+            with torch.inference_mode():
+                for inputs in warmup_batches:
+                    compiled(**inputs)
+            self._inference_model = compiled
+        except Exception as e:
+            print(f"torch.compile failed, using eager text model: {e}")
+            self._inference_model = model
+    
+    def _encode_texts(self, texts: List[str]) -> Dict[str, torch.Tensor]:
+        """Tokenize texts for the fine-tuned classifier"""
+        return self.classifier.tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            pad_to_multiple_of=PAD_MULTIPLE,
+            truncation=True,
+            max_length=BINARY_MAX_LENGTH
+        ).to(self.device)
+    
+    def _encode_pairs(self, texts: List[str]) -> Dict[str, torch.Tensor]:
+        """Tokenize every (text, label hypothesis) pair as one batch"""
+        return self.classifier.tokenizer(
+            [text for text in texts for _ in HYPOTHESES],
+            HYPOTHESES * len(texts),
+            return_tensors="pt",
+            padding=True,
+            pad_to_multiple_of=PAD_MULTIPLE,
+            truncation="only_first"
+        ).to(self.device)
+    
     def predict(
         self,
         text: str,
@@ -95,131 +326,198 @@ class TextFakeNewsDetector:
             return self._fallback_prediction(text)
         
         try:
-            # Use zero-shot classification with relevant labels
-            result = self.classifier(
-                text[:512],  # Truncate to avoid token limits
-                candidate_labels=[
-                    "fake news",
-                    "misinformation",
-                    "propaganda",
-                    "factual news",
-                    "reliable information"
-                ],
-                multi_label=True
-            )
+            # Classify (zero-shot labels or fine-tuned fake/real)
+            result = self._classify([text[:512]])[0]  # Truncate to avoid token limits
+            return self._build_prediction(text, result, return_features)
             
-            # Calculate fake probability from relevant labels
-            fake_labels = {"fake news", "misinformation", "propaganda"}
-            fake_scores = [
-                score for label, score in zip(result['labels'], result['scores'])
-                if label in fake_labels
-            ]
-            fake_prob = np.mean(fake_scores) if fake_scores else 0.3
+        except Exception as e:
+            print(f"Error in ML prediction: {e}")
+            return self._fallback_prediction(text)
+    
+    def _classify(
+        self,
+        inputs: List[str],
+        batch_size: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify inputs, serving repeats from the result cache
+        
+        Cache misses are classified together, batch_size texts per forward.
+        """
+        with self._result_cache_lock:
+            cached = {text: self._result_cache.get(text) for text in inputs}
+        misses = [text for text, result in cached.items() if result is None]
+        
+        if misses:
+            results = self._infer(misses, batch_size)
             
-            # Apply calibration (adjust these thresholds based on validation)
-            fake_prob = min(max(fake_prob, 0.0), 1.0)
+            with self._result_cache_lock:
+                for text, result in zip(misses, results):
+                    self._result_cache[text] = result
+                    cached[text] = result
+        
+        return [cached[text] for text in inputs]
+    
+    def _zero_shot(
+        self,
+        texts: List[str],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Multi-label zero-shot classification straight on the NLI model
+        
+        Same scores as the zero-shot pipeline, but all label hypotheses of a
+        text share one forward pass instead of one pass each.
+        """
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
             
-            prediction = {
-                'is_fake': fake_prob > 0.5,
-                'confidence': abs(fake_prob - 0.5) * 2,  # Convert to 0-1 scale
-                'fake_probability': fake_prob,
-                'real_probability': 1 - fake_prob,
-            }
+            with torch.inference_mode():
+                logits = self._inference_model(**self._encode_pairs(chunk)).logits
             
-            if return_features:
-                prediction['features'] = {
-                    'all_labels': result['labels'],
-                    'all_scores': result['scores'],
-                    'text_length': len(text),
-                    'model_used': 'zero-shot-bart'
-                }
+            # Entailment vs contradiction per hypothesis, labels independent
+            scores = logits[:, self._nli_label_ids].float().softmax(dim=-1)[:, 1]
+            for text, text_scores in zip(chunk, scores.view(len(chunk), -1).tolist()):
+                ranked = sorted(zip(CANDIDATE_LABELS, text_scores), key=itemgetter(1), reverse=True)
+                results.append({
+                    'sequence': text,
+                    'labels': [label for label, _ in ranked],
+                    'scores': [score for _, score in ranked],
+                })
+        
+        return results
+    
+    def _binary(
+        self,
+        texts: List[str],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fake probability from the fine-tuned classifier, one softmax per text
+        
+        Results use the zero-shot result layout, with the fake probability
+        under "fake news" and its complement under "factual news".
+        """
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
             
-            return prediction
+            with torch.inference_mode():
+                logits = self._inference_model(**self._encode_texts(chunk)).logits
             
-        except Exception as e:
-            print(f"Error in ML prediction: {e}")
-            return self._fallback_prediction(text)
-    
-    def _fallback_prediction(self, text: str) -> Dict[str, Any]:
-        """Enhanced rule-based prediction when ML model unavailable"""
-        text_lower = text.lower()
+            fake_probs = logits.float().softmax(dim=-1)[:, self._fake_label_id].tolist()
+            for text, fake_prob in zip(chunk, fake_probs):
+                ranked = sorted(
+                    [("fake news", fake_prob), ("factual news", 1 - fake_prob)],
+                    key=itemgetter(1),
+                    reverse=True
+                )
+                results.append({
+                    'sequence': text,
+                    'labels': [label for label, _ in ranked],
+                    'scores': [score for _, score in ranked],
+                })
         
-        # Expanded suspicious indicators with weights
-        clickbait_phrases = [
-            'you won\'t believe', 'shocking truth', 'doctors hate', 
-            'one weird trick', 'what happened next', 'mind blowing',
-            'this is why', 'the real reason', 'they don\'t want'
+        return results
+    
+    def _build_prediction(
+        self,
+        text: str,
+        result: Dict[str, Any],
+        return_features: bool
+    ) -> Dict[str, Any]:
+        """Turn a classification result into a prediction dict"""
+        # Calculate fake probability from relevant labels
+        fake_scores = [
+            score for label, score in zip(result['labels'], result['scores'])
+            if label in FAKE_LABELS
         ]
+        fake_prob = np.mean(fake_scores) if fake_scores else 0.3
         
-        emotional_manipulation = [
-            'outrageous', 'devastating', 'terrifying', 'horrifying',
-            'amazing', 'incredible', 'unbelievable', 'miracle',
-            'scandal', 'exposed', 'revealed', 'conspiracy'
-        ]
+        # Apply calibration (adjust these thresholds based on validation)
+        fake_prob = min(max(fake_prob, 0.0), 1.0)
         
-        urgency_words = [
-            'breaking', 'urgent', 'alert', 'warning', 'must read',
-            'immediately', 'right now', 'before it\'s too late',
-            'limited time', 'act now', 'don\'t miss'
-        ]
+        prediction = {
+            'is_fake': fake_prob > 0.5,
+            'confidence': abs(fake_prob - 0.5) * 2,  # Convert to 0-1 scale
+            'fake_probability': fake_prob,
+            'real_probability': 1 - fake_prob,
+        }
         
-        credibility_indicators = [
-            'study shows', 'research indicates', 'according to',
-            'expert', 'professor', 'dr.', 'ph.d.', 'university',
-            'institute', 'published', 'journal', 'peer-reviewed',
-            'data shows', 'statistics', 'evidence', 'analysis'
-        ]
+        if return_features:
+            prediction['features'] = {
+                # Copies, so callers never mutate the cached result
+                'all_labels': list(result['labels']),
+                'all_scores': list(result['scores']),
+                'text_length': len(text),
+                'model_used': self._model_used
+            }
         
-        source_citations = [
-            'source:', 'via', 'according to', 'reported by',
-            'published in', 'study by', 'cited in'
-        ]
+        return prediction
+    
+    def _fallback_prediction(self, text: str) -> Dict[str, Any]:
+        """Enhanced rule-based prediction when ML model unavailable"""
+        return self._fallback_predictions([text])[0]
+    
+    def _fallback_predictions(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Rule-based predictions for several texts
         
-        # Count indicators
-        clickbait_count = sum(1 for phrase in clickbait_phrases if phrase in text_lower)
-        emotional_count = sum(1 for word in emotional_manipulation if word in text_lower)
-        urgency_count = sum(1 for word in urgency_words if word in text_lower)
-        credibility_count = sum(1 for phrase in credibility_indicators if phrase in text_lower)
-        citation_count = sum(1 for phrase in source_citations if phrase in text_lower)
+        Indicators are gathered per text (one automaton pass each); the
+        scoring then runs column by column over all texts at once, in the
+        same operation order as the per-text formula.
+        """
+        rows = []
+        for text in texts:
+            # Count indicators (distinct phrases present per category)
+            counts = _count_phrases(text.lower())
+            
+            # Additional heuristics
+            words = text.split()
+            has_all_caps = any(word.isupper() and len(word) > 3 for word in words)
+            excessive_punctuation = text.count('!') > 3 or text.count('?') > 3
+            short_text = len(words) < 20
+            
+            rows.append((*counts, has_all_caps, excessive_punctuation, short_text))
         
-        # Additional heuristics
-        has_all_caps = any(word.isupper() and len(word) > 3 for word in text.split())
-        excessive_punctuation = text.count('!') > 3 or text.count('?') > 3
-        short_text = len(text.split()) < 20
+        inputs = np.array(rows, dtype=np.float64).reshape(len(rows), 8)
         
         # Calculate weighted fake score
-        fake_score = 0.3  # Base score
-        fake_score += clickbait_count * 0.12
-        fake_score += emotional_count * 0.08
-        fake_score += urgency_count * 0.10
-        fake_score -= credibility_count * 0.08
-        fake_score -= citation_count * 0.06
-        fake_score += 0.05 if has_all_caps else 0
-        fake_score += 0.05 if excessive_punctuation else 0
-        fake_score += 0.03 if short_text else 0
-        
-        fake_prob = min(max(fake_score, 0.15), 0.85)
+        fake_scores = 0.3 + inputs[:, 0] * 0.12  # Base score plus clickbait
+        fake_scores += inputs[:, 1] * 0.08   # emotional manipulation
+        fake_scores += inputs[:, 2] * 0.10   # urgency
+        fake_scores -= inputs[:, 3] * 0.08   # credibility markers
+        fake_scores -= inputs[:, 4] * 0.06   # source citations
+        fake_scores += inputs[:, 5] * 0.05   # all caps
+        fake_scores += inputs[:, 6] * 0.05   # excessive punctuation
+        fake_scores += inputs[:, 7] * 0.03   # short text
+        
+        fake_probs = np.clip(fake_scores, 0.15, 0.85)
         
         # Calculate confidence based on indicator strength
-        indicator_strength = clickbait_count + emotional_count + urgency_count + credibility_count
-        confidence = min(0.35 + (indicator_strength * 0.04), 0.65)
+        indicator_strength = inputs[:, :4].sum(axis=1)
+        confidences = np.minimum(0.35 + (indicator_strength * 0.04), 0.65)
         
-        return {
-            'is_fake': fake_prob > 0.5,
-            'confidence': confidence,
-            'fake_probability': fake_prob,
-            'real_probability': 1 - fake_prob,
-            'features': {
-                'clickbait_indicators': clickbait_count,
-                'emotional_manipulation': emotional_count,
-                'urgency_tactics': urgency_count,
-                'credibility_markers': credibility_count,
-                'source_citations': citation_count,
-                'has_all_caps': has_all_caps,
-                'excessive_punctuation': excessive_punctuation,
-                'model_used': 'enhanced-rule-based'
+        return [
+            {
+                'is_fake': fake_prob > 0.5,
+                'confidence': confidence,
+                'fake_probability': fake_prob,
+                'real_probability': 1 - fake_prob,
+                'features': {
+                    'clickbait_indicators': row[0],
+                    'emotional_manipulation': row[1],
+                    'urgency_tactics': row[2],
+                    'credibility_markers': row[3],
+                    'source_citations': row[4],
+                    'has_all_caps': row[5],
+                    'excessive_punctuation': row[6],
+                    'model_used': 'enhanced-rule-based'
+                }
             }
-        }
+            for row, fake_prob, confidence in zip(rows, fake_probs.tolist(), confidences.tolist())
+        ]
     
     def predict_batch(
         self,
@@ -236,19 +534,42 @@ class TextFakeNewsDetector:
         Returns:
             List of prediction dicts
         """
-        results = []
-        for text in texts:
-            results.append(self.predict(text, return_features=False))
-        return results
+        if self.classifier is None or not texts:
+            return self._fallback_predictions(texts)
+        
+        try:
+            results = self._classify(
+                [text[:512] for text in texts],  # Truncate to avoid token limits
+                batch_size=batch_size
+            )
+            
+            return [
+                self._build_prediction(text, result, return_features=False)
+                for text, result in zip(texts, results)
+            ]
+            
+        except Exception as e:
+            print(f"Error in batched ML prediction: {e}")
+            return self._fallback_predictions(texts)
     
-    def get_explanation(self, text: str) -> Dict[str, Any]:
+    def get_explanation(
+        self,
+        text: str,
+        prediction: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Get human-readable explanation for prediction
         
+        Args:
+            text: Input text to explain
+            prediction: predict(text, return_features=True) output, if the
+                caller already has it
+        
         Returns:
             Dict with explanation details
         """
-        prediction = self.predict(text, return_features=True)
+        if prediction is None:
+            prediction = self.predict(text, return_features=True)
         
         explanation = {
             'verdict': 'FAKE' if prediction['is_fake'] else 'REAL',
@@ -279,20 +600,23 @@ class TextFakeNewsDetector:
         
         return explanation
     
+    def unload(self):
+        """Release the model and return its cached GPU memory"""
+        self.classifier = None
+        self._inference_model = None
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+    
     def _get_confidence_level(self, confidence: float) -> str:
         """Convert confidence score to human-readable level"""
-        if confidence > 0.8:
-            return "Very High"
-        elif confidence > 0.6:
-            return "High"
-        elif confidence > 0.4:
-            return "Medium"
-        else:
-            return "Low"
+        return CONFIDENCE_LEVELS[bisect_left(CONFIDENCE_THRESHOLDS, confidence)]
 
 
 # Singleton instance for reuse
 _text_detector_instance = None
+_text_detector_lock = threading.Lock()
 
 
 def get_text_detector(
@@ -300,7 +624,7 @@ def get_text_detector(
     force_reload: bool = False
 ) -> TextFakeNewsDetector:
     """
-    Get or create text detector instance (singleton pattern)
+    Get or create text detector instance (thread-safe singleton)
     
     Args:
         model_name: Model to use
@@ -311,7 +635,23 @@ def get_text_detector(
     """
     global _text_detector_instance
     
-    if _text_detector_instance is None or force_reload:
-        _text_detector_instance = TextFakeNewsDetector(model_name=model_name)
+    def is_current() -> bool:
+        return (
+            _text_detector_instance is not None
+            and _text_detector_instance.model_name == model_name
+            and not force_reload
+        )
+    
+    # Fast path without the lock once loaded
+    if is_current():
+        return _text_detector_instance
+    
+    # Concurrent first calls would otherwise each load BART-MNLI
+    with _text_detector_lock:
+        if not is_current():
+            if _text_detector_instance is not None:
+                # Free the old weights first so a reload never holds two copies
+                _text_detector_instance.unload()
+            _text_detector_instance = TextFakeNewsDetector(model_name=model_name)
     
     return _text_detector_instance
@@ -1,13 +1,107 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import cv2
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
 from pathlib import Path
+import itertools
+import threading
 import warnings
 
+from app.core.config import settings
+from app.core.frame_pool import get_frame_pool
+
 warnings.filterwarnings('ignore')
 
+# OpenCV's ResNet-10 SSD face detector, looked up under MODELS_DIR
+FACE_NET_DIR = "face_detector"
+FACE_NET_PROTOTXT = "deploy.prototxt"
+FACE_NET_WEIGHTS = "res10_300x300_ssd_iter_140000.caffemodel"
+FACE_NET_INPUT = (300, 300)
+FACE_NET_MEAN = (104.0, 177.0, 123.0)
+FACE_CONFIDENCE = 0.5
+
+# ITU-R BT.601 luma weights in OpenCV's BGR channel order
+BT601_BGR = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+
+# 4-neighbour Laplacian, the kernel cv2.Laplacian uses with ksize=1
+LAPLACIAN_KERNEL = torch.tensor(
+    [[0.0, 1.0, 0.0], [1.0, -4.0, 1.0], [0.0, 1.0, 0.0]]
+).view(1, 1, 3, 3)
+
+# Frame statistics and optical flow barely change under downsampling, so
+# they are computed on these (width, height) copies instead of full frames
+ANALYSIS_SIZE = (256, 256)
+FLOW_SIZE = (320, 240)
+
+# Eye cascade is unreliable on faces smaller than this (pixels, analysis size)
+EYE_CHECK_MIN_FACE_AREA = 60 * 60
+
+# Deepfake heuristics as a rule table (same layout as the audio detector's).
+# A rule fires when its signal lies outside [lo, hi] but inside
+# [outer_lo, outer_hi]; the outer band keeps a mild tier from firing
+# alongside the severe tier of the same signal. Rows are in reporting order.
+_RULES = np.array([
+    # Face count consistency across frames, and impossible face counts
+    ('face_variance', -np.inf, 2.0, -np.inf, np.inf, 0.20, "Severe face detection inconsistency"),
+    ('face_variance', -np.inf, 1.5, -np.inf, 2.0, 0.12, "Inconsistent face detection across frames"),
+    ('avg_faces', -np.inf, 5, -np.inf, np.inf, 0.10, "Unusually high face count"),
+    # High face size variance indicates manipulation
+    ('size_variance', -np.inf, 0.7, -np.inf, np.inf, 0.18, "Severe face size variations"),
+    ('size_variance', -np.inf, 0.5, -np.inf, 0.7, 0.12, "Unusual face size variations"),
+    # Natural face ratio is around 0.7-0.9
+    ('mean_ratio', 0.5, 1.2, -np.inf, np.inf, 0.15, "Unnatural face aspect ratio"),
+    ('sharpness', 25, np.inf, -np.inf, np.inf, 0.12, "Poor video sharpness (possible processing)"),
+    ('contrast', 15, np.inf, -np.inf, np.inf, 0.10, "Low contrast (possible manipulation)"),
+    # Compression artifacts might hide deepfake traces
+    ('compression_artifacts', -np.inf, 0.7, -np.inf, np.inf, 0.08, "High compression artifacts"),
+    # Edge blending artifacts (common in face swaps)
+    ('edge_inconsistency', -np.inf, 0.6, -np.inf, np.inf, 0.20, "Edge blending artifacts detected"),
+    ('edge_inconsistency', -np.inf, 0.4, -np.inf, 0.6, 0.10, "Minor edge inconsistencies"),
+    ('scene_change_rate', -np.inf, 0.3, -np.inf, np.inf, 0.08, "Excessive scene changes"),
+    ('lighting_consistency', 0.6, np.inf, -np.inf, np.inf, 0.15, "Inconsistent lighting across frames"),
+    ('sharpness', 20, np.inf, -np.inf, np.inf, 0.15, "Very low video sharpness"),
+    ('noise', -np.inf, 20, -np.inf, np.inf, 0.10, "High noise level"),
+    # Frame brightness too consistent (unnatural) or too varied
+    ('brightness_std', 2, np.inf, -np.inf, np.inf, 0.12, "Unnaturally consistent lighting"),
+    ('brightness_std', -np.inf, 80, -np.inf, np.inf, 0.10, "Erratic lighting changes"),
+    # Share of frames with sharp edges around faces
+    ('edge_artifact_rate', -np.inf, 0.3, -np.inf, np.inf, 0.20, "Edge artifacts detected around faces"),
+], dtype=[
+    ('key', 'U32'),
+    ('lo', 'f8'), ('hi', 'f8'), ('outer_lo', 'f8'), ('outer_hi', 'f8'),
+    ('penalty', 'f8'), ('message', 'U64'),
+])
+_RULE_KEYS = _RULES['key'].tolist()
+
+
+@dataclass
+class FrameScores:
+    """Per-frame analysis as parallel columns, one row per analyzed frame"""
+    brightness: np.ndarray
+    contrast: np.ndarray
+    suspicious: np.ndarray
+    edge_artifacts: np.ndarray
+    faces_detected: np.ndarray
+    issues: List[List[str]]
+    
+    def to_dicts(self, limit: int) -> List[Dict[str, Any]]:
+        """The first `limit` rows in the API's per-frame dict format"""
+        return [
+            {
+                'frame_idx': idx,
+                'suspicious': bool(self.suspicious[idx]),
+                'brightness': float(self.brightness[idx]),
+                'contrast': float(self.contrast[idx]),
+                'edge_artifacts': bool(self.edge_artifacts[idx]),
+                'faces_detected': int(self.faces_detected[idx]),
+                'issues': self.issues[idx],
+            }
+            for idx in range(min(limit, len(self.issues)))
+        ]
+
 
 class VideoDeepfakeDetector:
     """
@@ -22,37 +116,131 @@ class VideoDeepfakeDetector:
     For now, uses heuristic-based detection on extracted frames
     """
     
-    def __init__(self, device: Optional[str] = None):
-        """Initialize video deepfake detector"""
+    def __init__(self, device: Optional[str] = None, max_analysis_frames: int = 32):
+        """
+        Initialize video deepfake detector
+        
+        Args:
+            device: Device for the GPU frame statistics (None for auto)
+            max_analysis_frames: Longer frame lists are stride-sampled down to this
+        """
         if device is None:
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
         else:
             self.device = device
+        self.max_analysis_frames = max_analysis_frames
         
         print(f"Video deepfake detector initialized on: {self.device}")
         
-        # Load face detection cascade
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
+        # DNN face detector (batched, CUDA when OpenCV has it); the Haar
+        # cascade is used when its weights are not installed
+        self.face_net = self._load_face_net()
         
-        # Load eye cascade for additional verification
-        self.eye_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_eye.xml'
-        )
+        # Haar cascades, DIS flow objects and pinned upload buffers keep
+        # per-call state, so each thread gets its own
+        self._cascade_local = threading.local()
+        self._flow_local = threading.local()
+        self._pinned_local = threading.local()
+        
+        # Frames are analyzed in parallel on the process-wide frame pool,
+        # whose long-lived threads load their cascades only once
+        self._frame_pool = get_frame_pool()
+    
+    @property
+    def face_cascade(self) -> cv2.CascadeClassifier:
+        """This thread's face detection cascade"""
+        cascade = getattr(self._cascade_local, 'face', None)
+        if cascade is None:
+            cascade = cv2.CascadeClassifier(
+                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+            )
+            self._cascade_local.face = cascade
+        return cascade
+    
+    @property
+    def eye_cascade(self) -> cv2.CascadeClassifier:
+        """This thread's eye cascade, for additional verification"""
+        cascade = getattr(self._cascade_local, 'eye', None)
+        if cascade is None:
+            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
+            self._cascade_local.eye = cascade
+        return cascade
+    
+    @property
+    def dis(self):
+        """
+        This thread's DIS optical flow estimator; only the mean magnitude is
+        used, which the ultrafast preset estimates far cheaper than Farneback
+        """
+        dis = getattr(self._flow_local, 'dis', None)
+        if dis is None:
+            dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_ULTRAFAST)
+            self._flow_local.dis = dis
+        return dis
+    
+    def _load_face_net(self):
+        """Load the SSD face detector from MODELS_DIR, or None if absent"""
+        model_dir = Path(settings.MODELS_DIR) / FACE_NET_DIR
+        prototxt = model_dir / FACE_NET_PROTOTXT
+        weights = model_dir / FACE_NET_WEIGHTS
+        if not (prototxt.exists() and weights.exists()):
+            return None
+        
+        try:
+            net = cv2.dnn.readNetFromCaffe(str(prototxt), str(weights))
+            if self.device == "cuda" and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+                net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+            print("DNN face detector loaded")
+            return net
+        except Exception as e:
+            print(f"Error loading DNN face detector, using Haar cascade: {e}")
+            return None
+    
+    def detect_faces_batch(self, frames: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Detect faces in all frames with one DNN forward pass
+        
+        Args:
+            frames: Video frames (any size; resized to the network input)
+        
+        Returns:
+            Per frame, an (N, 4) int array of (x, y, width, height) boxes
+        """
+        blob = cv2.dnn.blobFromImages(frames, 1.0, FACE_NET_INPUT, FACE_NET_MEAN)
+        self.face_net.setInput(blob)
+        # Rows of (image index, class, confidence, x1, y1, x2, y2), coords in [0, 1]
+        detections = self.face_net.forward().reshape(-1, 7)
+        detections = detections[detections[:, 2] >= FACE_CONFIDENCE]
+        
+        faces = []
+        for idx, frame in enumerate(frames):
+            height, width = frame.shape[:2]
+            scale = np.array([width, height, width, height])
+            corners = detections[detections[:, 0] == idx, 3:7] * scale
+            corners = np.clip(corners, 0, scale).astype(int)
+            boxes = np.column_stack([
+                corners[:, :2], corners[:, 2:] - corners[:, :2]
+            ])
+            faces.append(boxes[(boxes[:, 2] > 0) & (boxes[:, 3] > 0)])
+        return faces
     
     def detect_from_frames(
         self,
-        frames: List[np.ndarray],
+        frames: Iterable[np.ndarray],
         face_data: List[Dict[str, Any]],
         quality_metrics: Dict[str, float]
     ) -> Dict[str, Any]:
         """
         Detect deepfakes from extracted frames and metadata
         
+        Frames are consumed one at a time and only downsampled copies are
+        kept, so a generator avoids holding the decoded video in memory.
+        
         Args:
-            frames: List of video frames
-            face_data: Face detection data per frame
+            frames: Video frames (list or any iterable)
+            face_data: Face detection data per frame (frame_index and
+                full-frame face_locations)
             quality_metrics: Video quality metrics
         
         Returns:
@@ -63,129 +251,117 @@ class VideoDeepfakeDetector:
                 - indicators: List of suspicious indicators
                 - frame_scores: Per-frame analysis
         """
-        indicators = []
-        suspicion_score = 0.0
-        frame_scores = []
-        
         # Enhanced face consistency analysis
-        face_counts = [len(f.get('face_locations', [])) for f in face_data]
-        if face_counts:
-            face_variance = np.std(face_counts)
-            avg_faces = np.mean(face_counts)
-            
-            # More sophisticated inconsistency detection
-            if face_variance > 2.0:
-                indicators.append("Severe face detection inconsistency")
-                suspicion_score += 0.20
-            elif face_variance > 1.5:
-                indicators.append("Inconsistent face detection across frames")
-                suspicion_score += 0.12
-            
-            # Check for impossible face counts
-            if avg_faces > 5:
-                indicators.append("Unusually high face count")
-                suspicion_score += 0.10
-        
-        # Enhanced face size analysis
-        face_sizes = []
-        face_aspect_ratios = []
-        for frame_data in face_data:
-            for face in frame_data.get('face_locations', []):
-                w, h = face[2], face[3]
-                face_sizes.append(w * h)
-                if h > 0:
-                    face_aspect_ratios.append(w / h)
-        
-        if face_sizes:
-            size_variance = np.std(face_sizes) / (np.mean(face_sizes) + 1e-6)
-            if size_variance > 0.7:  # High variance indicates manipulation
-                indicators.append("Severe face size variations")
-                suspicion_score += 0.18
-            elif size_variance > 0.5:
-                indicators.append("Unusual face size variations")
-                suspicion_score += 0.12
-        
-        # Check face aspect ratios for unnatural distortions
-        if face_aspect_ratios:
-            mean_ratio = np.mean(face_aspect_ratios)
-            # Natural face ratio is around 0.7-0.9
-            if mean_ratio < 0.5 or mean_ratio > 1.2:
-                indicators.append("Unnatural face aspect ratio")
-                suspicion_score += 0.15
+        face_counts = np.fromiter(
+            (len(f.get('face_locations', [])) for f in face_data),
+            dtype=np.float32,
+            count=len(face_data)
+        )
+        
+        # Enhanced face size analysis over all (x, y, w, h) boxes at once
+        boxes = [
+            np.asarray(frame_data['face_locations'], dtype=np.float32).reshape(-1, 4)
+            for frame_data in face_data if len(frame_data.get('face_locations', [])) > 0
+        ]
+        all_faces = np.concatenate(boxes) if boxes else np.empty((0, 4), dtype=np.float32)
+        widths, heights = all_faces[:, 2], all_faces[:, 3]
+        face_sizes = widths * heights
+        has_height = heights > 0
+        face_aspect_ratios = widths[has_height] / heights[has_height]
+        
+        # Each frame's full-frame face boxes, by its index in frames
+        boxes_by_frame = {
+            frame_data['frame_index']: np.asarray(
+                frame_data['face_locations'], dtype=np.float32
+            ).reshape(-1, 4)
+            for frame_data in face_data if 'frame_index' in frame_data
+        }
+        no_faces = np.empty((0, 4), dtype=np.float32)
+        
+        # Neighbouring frames are near-duplicates, so long frame lists are
+        # stride-sampled; counts over sampled frames are scaled back by stride
+        frame_stride = 1
+        indexed_frames = enumerate(frames)
+        if hasattr(frames, '__len__'):
+            total_frames = len(frames)
+            frame_stride = max(1, total_frames // self.max_analysis_frames)
+            indexed_frames = itertools.islice(indexed_frames, None, None, frame_stride)
+        
+        # Reduce each frame to its analysis copy, with the caller's face
+        # boxes mapped onto it (faces are not detected a second time)
+        small_frames = []
+        frame_faces = []
+        for idx, frame in indexed_frames:
+            small_frames.append(cv2.resize(frame, ANALYSIS_SIZE, interpolation=cv2.INTER_AREA))
+            frame_faces.append(self._scale_boxes(boxes_by_frame.get(idx, no_faces), frame))
+        num_frames = len(small_frames)
+        if frame_stride == 1:
+            total_frames = num_frames
         
         # Analyze frames for manipulation artifacts
-        for idx, frame in enumerate(frames):
-            frame_analysis = self._analyze_single_frame(frame, idx, face_data)
-            frame_scores.append(frame_analysis)
-            
-            if frame_analysis['suspicious']:
-                suspicion_score += 0.05  # Small increment per suspicious frame
-        
-        # Enhanced quality metrics analysis
-        if quality_metrics.get('sharpness', 0) < 25:
-            indicators.append("Poor video sharpness (possible processing)")
-            suspicion_score += 0.12
-        
-        if quality_metrics.get('contrast', 0) < 15:
-            indicators.append("Low contrast (possible manipulation)")
-            suspicion_score += 0.10
-        
-        # Check for compression artifacts that might hide deepfake traces
-        if quality_metrics.get('compression_artifacts', 0) > 0.7:
-            indicators.append("High compression artifacts")
-            suspicion_score += 0.08
-        
-        # Check for edge blending artifacts (common in face swaps)
-        edge_inconsistency = quality_metrics.get('edge_inconsistency', 0)
-        if edge_inconsistency > 0.6:
-            indicators.append("Edge blending artifacts detected")
-            suspicion_score += 0.20
-        elif edge_inconsistency > 0.4:
-            indicators.append("Minor edge inconsistencies")
-            suspicion_score += 0.10
-        
-        # Analyze scene changes for unnatural transitions
-        scene_changes = quality_metrics.get('scene_changes', 0)
-        total_frames = len(frames)
-        if total_frames > 0:
-            change_rate = scene_changes / total_frames
-            if change_rate > 0.3:  # Too many scene changes
-                indicators.append("Excessive scene changes")
-                suspicion_score += 0.08
-        
-        # Check lighting consistency across frames
-        if 'lighting_consistency' in quality_metrics:
-            lighting = quality_metrics['lighting_consistency']
-            if lighting < 0.6:
-                indicators.append("Inconsistent lighting across frames")
-                suspicion_score += 0.15
-        
-        # Check for noise and additional quality issues
-        if quality_metrics.get('sharpness', 0) < 20:
-            indicators.append("Very low video sharpness")
-            suspicion_score += 0.15
-        
-        if quality_metrics.get('noise', 0) > 20:
-            indicators.append("High noise level")
-            suspicion_score += 0.10
-        
-        # Enhanced lighting consistency check
-        brightness_values = [frame_scores[i].get('brightness', 128) 
-                            for i in range(len(frame_scores))]
-        if len(brightness_values) > 1:
-            brightness_std = np.std(brightness_values)
-            if brightness_std < 2:  # Too consistent (unnatural)
-                indicators.append("Unnaturally consistent lighting")
-                suspicion_score += 0.12
-            elif brightness_std > 80:  # Too varied
-                indicators.append("Erratic lighting changes")
-                suspicion_score += 0.10
-        
-        # Enhanced edge artifact detection around faces
-        edge_artifacts = sum(1 for fs in frame_scores if fs.get('edge_artifacts', False))
-        if len(frames) > 0 and edge_artifacts > len(frames) * 0.3:
-            indicators.append("Edge artifacts detected around faces")
-            suspicion_score += 0.20
+        frame_statistics = (
+            self._frame_statistics_gpu if self.device == "cuda" else self._frame_statistics
+        )
+        gray_frames, brightness_values, contrast_values, laplacian_vars = (
+            frame_statistics(small_frames) if num_frames else ((),) * 4
+        )
+        
+        # (suspicious, edge_artifacts, faces_detected, issues) per frame,
+        # transposed into columns
+        frame_results = list(self._frame_pool.map(
+            self._analyze_single_frame, gray_frames, laplacian_vars, frame_faces
+        ))
+        suspicious, edge_artifacts, faces_detected, issues = (
+            zip(*frame_results) if frame_results else ((),) * 4
+        )
+        frame_scores = FrameScores(
+            brightness=np.asarray(brightness_values, dtype=np.float32),
+            contrast=np.asarray(contrast_values, dtype=np.float32),
+            suspicious=np.array(suspicious, dtype=bool),
+            edge_artifacts=np.array(edge_artifacts, dtype=bool),
+            faces_detected=np.array(faces_detected, dtype=np.int32),
+            issues=list(issues),
+        )
+        
+        # Signals the rule table reads; NaN where there is nothing to measure
+        # (NaN never flags). Missing quality metrics count as 0, as before
+        signals = {
+            'face_variance': face_counts.std() if face_counts.size else np.nan,
+            'avg_faces': face_counts.mean() if face_counts.size else np.nan,
+            'size_variance': (
+                face_sizes.std() / (face_sizes.mean() + 1e-6) if face_sizes.size else np.nan
+            ),
+            'mean_ratio': face_aspect_ratios.mean() if face_aspect_ratios.size else np.nan,
+            'sharpness': quality_metrics.get('sharpness', 0),
+            'contrast': quality_metrics.get('contrast', 0),
+            'compression_artifacts': quality_metrics.get('compression_artifacts', 0),
+            'edge_inconsistency': quality_metrics.get('edge_inconsistency', 0),
+            'scene_change_rate': (
+                quality_metrics.get('scene_changes', 0) / total_frames if total_frames > 0
+                else np.nan
+            ),
+            'lighting_consistency': quality_metrics.get('lighting_consistency', np.nan),
+            'noise': quality_metrics.get('noise', 0),
+            'brightness_std': (
+                frame_scores.brightness.std() if num_frames > 1 else np.nan
+            ),
+            'edge_artifact_rate': (
+                frame_scores.edge_artifacts.mean() if num_frames > 0 else np.nan
+            ),
+        }
+        values = np.array([signals[key] for key in _RULE_KEYS], dtype=np.float64)
+        
+        # Outside [lo, hi] but inside the outer band (see _RULES)
+        flagged = (
+            ((values < _RULES['lo']) | (values > _RULES['hi']))
+            & (values >= _RULES['outer_lo'])
+            & (values <= _RULES['outer_hi'])
+        )
+        indicators = _RULES['message'][flagged].tolist()
+        
+        # Rule penalties plus a small increment per suspicious frame
+        suspicious_frames = int(frame_scores.suspicious.sum()) * frame_stride
+        suspicion_score = float(_RULES['penalty'][flagged].sum()) + 0.05 * suspicious_frames
         
         # Normalize suspicion score
         suspicion_score = min(suspicion_score, 1.0)
@@ -202,44 +378,121 @@ class VideoDeepfakeDetector:
             'authenticity_score': authenticity_score,
             'suspicion_score': suspicion_score,
             'indicators': indicators,
-            'frame_scores': frame_scores[:5],  # First 5 frame analyses
-            'frames_analyzed': len(frames),
-            'suspicious_frames': sum(1 for fs in frame_scores if fs['suspicious']),
+            'frame_scores': frame_scores.to_dicts(5),  # First 5 frame analyses
+            'frames_analyzed': num_frames,
+            'suspicious_frames': suspicious_frames,
             'method': 'heuristic-frame-analysis',
         }
     
+    @staticmethod
+    def _scale_boxes(faces: np.ndarray, frame: np.ndarray) -> np.ndarray:
+        """Map (x, y, w, h) boxes from full-frame to ANALYSIS_SIZE coordinates"""
+        height, width = frame.shape[:2]
+        scale = np.array([ANALYSIS_SIZE[0] / width, ANALYSIS_SIZE[1] / height] * 2)
+        return (faces * scale).astype(int)
+    
+    @staticmethod
+    def _frame_statistics(
+        frames: List[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Grayscale planes and per-frame metrics for all frames at once
+        
+        Returns:
+            (gray (N, H, W), brightness (N,), contrast (N,), laplacian_var (N,))
+        """
+        gray = np.rint(np.stack(frames) @ BT601_BGR).astype(np.uint8)
+        flat = gray.reshape(len(gray), -1)
+        
+        # 4-neighbour Laplacian (cv2.Laplacian ksize=1) with its reflect-101 border
+        padded = np.pad(gray.astype(np.float32), ((0, 0), (1, 1), (1, 1)), mode='reflect')
+        laplacian = (
+            padded[:, :-2, 1:-1] + padded[:, 2:, 1:-1]
+            + padded[:, 1:-1, :-2] + padded[:, 1:-1, 2:]
+            - 4 * padded[:, 1:-1, 1:-1]
+        )
+        laplacian_var = laplacian.reshape(len(gray), -1).var(axis=1)
+        
+        return (
+            gray,
+            flat.mean(axis=1, dtype=np.float32),
+            flat.std(axis=1, dtype=np.float32),
+            laplacian_var,
+        )
+    
+    def _frame_statistics_gpu(
+        self,
+        frames: List[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """GPU version of _frame_statistics: one upload, one conv, one download"""
+        with torch.inference_mode():
+            stack = self._pinned_frames(len(frames))
+            np.stack(frames, out=stack.numpy())
+            stack = stack.to(self.device, non_blocking=True).float()
+            luma = torch.from_numpy(BT601_BGR).to(self.device)
+            gray = torch.round(stack @ luma)
+            flat = gray.flatten(1)
+            
+            padded = F.pad(gray[:, None], (1, 1, 1, 1), mode='reflect')
+            laplacian = F.conv2d(padded, LAPLACIAN_KERNEL.to(self.device))
+            
+            stats = torch.stack([
+                flat.mean(dim=1),
+                flat.std(dim=1, unbiased=False),
+                laplacian.flatten(1).var(dim=1, unbiased=False),
+            ]).cpu().numpy()
+            gray = gray.to(torch.uint8).cpu().numpy()
+        
+        return (gray, *stats)
+    
+    def _pinned_frames(self, count: int) -> torch.Tensor:
+        """This thread's page-locked (count, H, W, 3) upload buffer, grown on demand"""
+        pinned = getattr(self._pinned_local, 'frames', None)
+        if pinned is None or pinned.shape[0] < count:
+            pinned = torch.empty(
+                (count, ANALYSIS_SIZE[1], ANALYSIS_SIZE[0], 3),
+                dtype=torch.uint8,
+                pin_memory=True
+            )
+            self._pinned_local.frames = pinned
+        return pinned[:count]
+    
     def _analyze_single_frame(
         self,
-        frame: np.ndarray,
-        frame_idx: int,
-        face_data: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Analyze a single frame for deepfake indicators"""
-        suspicious = False
-        issues = []
-        
-        # Convert to grayscale for analysis
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray: np.ndarray,
+        laplacian_var: float,
+        faces: np.ndarray
+    ) -> Tuple[bool, bool, int, List[str]]:
+        """
+        Analyze a single frame for deepfake indicators from precomputed metrics
         
-        # Calculate frame metrics
-        brightness = np.mean(gray)
-        contrast = np.std(gray)
+        Faces are (x, y, w, h) boxes in the analysis copy's coordinates.
         
-        # Detect faces
-        faces = self.face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-        )
+        Returns:
+            (suspicious, edge_artifacts, faces_detected, issues)
+        """
+        suspicious = False
+        issues = []
         
         # Check for face-related anomalies
         edge_artifacts = False
         if len(faces) > 0:
+            # One Canny map per frame; its integral image gives each face's
+            # edge count from four lookups, however many boxes overlap
+            edge_sums = cv2.integral(cv2.Canny(gray, 50, 150))
+            height, width = gray.shape
+            
             for (x, y, w, h) in faces:
                 # Extract face region
-                face_roi = frame[y:y+h, x:x+w]
-                if face_roi.size > 0:
-                    # Check edges around face
-                    edges = cv2.Canny(gray[y:y+h, x:x+w], 50, 150)
-                    edge_density = np.sum(edges > 0) / edges.size
+                face_gray = gray[y:y+h, x:x+w]
+                if face_gray.size > 0:
+                    # Check edges around face (Canny marks edges as 255)
+                    x2, y2 = min(x + w, width), min(y + h, height)
+                    edge_count = (
+                        edge_sums[y2, x2] - edge_sums[y, x2]
+                        - edge_sums[y2, x] + edge_sums[y, x]
+                    ) / 255
+                    edge_density = edge_count / face_gray.size
                     
                     # Unusually sharp edges might indicate compositing
                     if edge_density > 0.2:
@@ -247,8 +500,10 @@ class VideoDeepfakeDetector:
                         issues.append("Sharp edges around face")
                         suspicious = True
                     
-                    # Check for eye detection within face
-                    face_gray = gray[y:y+h, x:x+w]
+                    # Check for eye detection within face; skipped once the
+                    # frame is already suspicious or the face is too small
+                    if suspicious or w * h < EYE_CHECK_MIN_FACE_AREA:
+                        continue
                     eyes = self.eye_cascade.detectMultiScale(face_gray)
                     
                     # Expect 2 eyes; significant deviation is suspicious
@@ -256,20 +511,11 @@ class VideoDeepfakeDetector:
                         issues.append(f"Unusual eye count: {len(eyes)}")
         
         # Check for compression artifacts
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
         if laplacian_var < 10:  # Very low variance
             issues.append("Low detail variance")
             suspicious = True
         
-        return {
-            'frame_idx': frame_idx,
-            'suspicious': suspicious,
-            'brightness': float(brightness),
-            'contrast': float(contrast),
-            'edge_artifacts': edge_artifacts,
-            'faces_detected': len(faces),
-            'issues': issues,
-        }
+        return suspicious, edge_artifacts, len(faces), issues
     
     def analyze_temporal_consistency(
         self,
@@ -284,26 +530,48 @@ class VideoDeepfakeDetector:
         
         inconsistencies = []
         
+        # DIS flow runs on FLOW_SIZE frames; vectors are scaled back to full-frame
+        # pixels so the motion threshold keeps its meaning
+        height, width = frames[0].shape[:2]
+        flow_scale = np.array([width / FLOW_SIZE[0], height / FLOW_SIZE[1]], dtype=np.float32)
+        
+        # Resize and grayscale buffers are allocated once; the two gray
+        # buffers alternate between the "previous" and "current" roles
+        small_buf = np.empty((FLOW_SIZE[1], FLOW_SIZE[0], 3), dtype=np.uint8)
+        gray_bufs = [np.empty((FLOW_SIZE[1], FLOW_SIZE[0]), dtype=np.uint8) for _ in range(2)]
+        
+        def to_gray(frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+            small = cv2.resize(frame, FLOW_SIZE, dst=small_buf, interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=out)
+        
+        # Each frame is converted once and reused as the next pair's previous
+        # frame; the flow buffer is reused across pairs
+        dis = self.dis
+        flow = np.zeros((FLOW_SIZE[1], FLOW_SIZE[0], 2), dtype=np.float32)
+        prev_gray = to_gray(frames[0], gray_bufs[0])
+        
         # Compare consecutive frames
-        for i in range(len(frames) - 1):
-            frame1 = cv2.cvtColor(frames[i], cv2.COLOR_BGR2GRAY)
-            frame2 = cv2.cvtColor(frames[i+1], cv2.COLOR_BGR2GRAY)
+        for i in range(1, len(frames)):
+            cur_gray = to_gray(frames[i], gray_bufs[i % 2])
             
-            # Calculate optical flow
+            # Calculate optical flow (DIS treats a non-empty buffer as the
+            # initial estimate, so start every pair from zero)
             try:
-                flow = cv2.calcOpticalFlowFarneback(
-                    frame1, frame2, None, 0.5, 3, 15, 3, 5, 1.2, 0
-                )
+                flow.fill(0)
+                dis.calc(prev_gray, cur_gray, flow)
                 
                 # Analyze flow magnitude
-                magnitude = np.sqrt(flow[..., 0]**2 + flow[..., 1]**2)
+                flow *= flow_scale
+                magnitude = np.hypot(flow[..., 0], flow[..., 1])
                 avg_magnitude = np.mean(magnitude)
                 
                 # Unnatural jumps in motion
                 if avg_magnitude > 50:  # Threshold for unusual motion
-                    inconsistencies.append(f"Frame {i}-{i+1}: Unusual motion")
+                    inconsistencies.append(f"Frame {i-1}-{i}: Unusual motion")
             except:
                 pass
+            
+            prev_gray = cur_gray
         
         consistency_score = 1.0 - (len(inconsistencies) / max(len(frames), 1))
         
@@ -316,15 +584,21 @@ class VideoDeepfakeDetector:
 
 # Singleton instance
 _video_detector_instance = None
+_video_detector_lock = threading.Lock()
 
 
 def get_video_deepfake_detector(
     force_reload: bool = False
 ) -> VideoDeepfakeDetector:
-    """Get or create video deepfake detector instance"""
+    """Get or create video deepfake detector instance (thread-safe)"""
     global _video_detector_instance
     
-    if _video_detector_instance is None or force_reload:
-        _video_detector_instance = VideoDeepfakeDetector()
+    # Fast path without the lock once loaded
+    if _video_detector_instance is not None and not force_reload:
+        return _video_detector_instance
+    
+    with _video_detector_lock:
+        if _video_detector_instance is None or force_reload:
+            _video_detector_instance = VideoDeepfakeDetector()
     
     return _video_detector_instance
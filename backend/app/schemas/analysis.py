@@ -1,3 +1,4 @@
+import msgspec
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -40,6 +41,25 @@ class AnalysisResponse(AnalysisBase):
         from_attributes = True
 
 
+class AnalysisResponseOut(msgspec.Struct):
+    """
+    Serialization-only mirror of AnalysisResponse for server-built payloads
+    
+    Encoded straight to JSON bytes by msgspec; AnalysisResponse stays the
+    documented schema and validates data read back from the store.
+    """
+    filename: str
+    file_type: FileType
+    file_size: int
+    id: str
+    status: AnalysisStatus
+    uploaded_at: datetime
+    completed_at: Optional[datetime] = None
+    credibility_score: Optional[float] = None
+    confidence: Optional[float] = None
+    result_data: Optional[Dict[str, Any]] = None
+
+
 class TextAnalysisResult(BaseModel):
     score: float = Field(..., ge=0, le=100)
     confidence: float = Field(..., ge=0, le=1)
@@ -0,0 +1,132 @@
+"""Shared analysis record store backed by Redis"""
+from functools import partial
+from typing import Dict, Any, Optional
+
+import numpy as np
+import orjson
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.schemas.analysis import FileType
+
+
+def _numpy_to_native(obj: Any) -> Any:
+    """Arrays orjson cannot take directly (non-contiguous, unusual dtypes)"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError
+
+
+# ML results carry NumPy scalars/arrays and int-keyed dicts; orjson encodes
+# both natively, so analyzers return them as-is and no conversion pass is
+# needed before storing
+_encode = partial(
+    orjson.dumps,
+    default=_numpy_to_native,
+    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+)
+
+
+class AnalysisStore:
+    """
+    Keeps analysis records in Redis so every API worker sees the same state
+
+    Records are stored as orjson-encoded blobs under
+    ``analysis:{file_type}:{id}``, so an id only resolves for the modality
+    that created it, and expire after ``ttl`` seconds so finished analyses
+    do not accumulate.
+    """
+
+    def __init__(self, url: str, ttl: int):
+        self.ttl = ttl
+        self._redis = aioredis.from_url(url, decode_responses=False)
+
+    @staticmethod
+    def _key(file_type: FileType, analysis_id: str) -> str:
+        return f"analysis:{file_type.value}:{analysis_id}"
+
+    async def set(self, file_type: FileType, analysis_id: str, record: Dict[str, Any]) -> None:
+        """Store (or replace) the record for an analysis"""
+        await self._redis.set(
+            self._key(file_type, analysis_id),
+            _encode(record),
+            ex=self.ttl,
+        )
+
+    async def get(self, file_type: FileType, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for an analysis, or None if unknown/expired"""
+        raw = await self._redis.get(self._key(file_type, analysis_id))
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class SyncAnalysisStore:
+    """
+    Blocking counterpart of AnalysisStore for Dramatiq worker processes
+
+    Shares the key layout and encoding so the API reads what workers write.
+    """
+
+    def __init__(self, url: str, ttl: int):
+        self.ttl = ttl
+        self._redis = redis.Redis.from_url(url, decode_responses=False)
+
+    def set(self, file_type: FileType, analysis_id: str, record: Dict[str, Any]) -> None:
+        """Store (or replace) the record for an analysis"""
+        self._redis.set(
+            AnalysisStore._key(file_type, analysis_id),
+            _encode(record),
+            ex=self.ttl,
+        )
+
+    def get(self, file_type: FileType, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for an analysis, or None if unknown/expired"""
+        raw = self._redis.get(AnalysisStore._key(file_type, analysis_id))
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+
+# Singleton instances
+_store_instance: Optional[AnalysisStore] = None
+_sync_store_instance: Optional[SyncAnalysisStore] = None
+
+
+def get_analysis_store() -> AnalysisStore:
+    """Get or create the analysis store (one connection pool per process)"""
+    global _store_instance
+
+    if _store_instance is None:
+        _store_instance = AnalysisStore(
+            url=settings.REDIS_URL,
+            ttl=settings.ANALYSIS_TTL_SECONDS,
+        )
+
+    return _store_instance
+
+
+async def close_analysis_store() -> None:
+    """Close the analysis store connection pool"""
+    global _store_instance
+
+    if _store_instance is not None:
+        await _store_instance.close()
+        _store_instance = None
+
+
+def get_sync_analysis_store() -> SyncAnalysisStore:
+    """Get or create the blocking analysis store used by workers"""
+    global _sync_store_instance
+
+    if _sync_store_instance is None:
+        _sync_store_instance = SyncAnalysisStore(
+            url=settings.REDIS_URL,
+            ttl=settings.ANALYSIS_TTL_SECONDS,
+        )
+
+    return _sync_store_instance
@@ -1,32 +1,86 @@
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import librosa
 import numpy as np
+import torch
 
 # Lazy load ML models
 _whisper_model = None
 _deepfake_detector = None
 
+# Rate the signal analyses resample to
+ANALYSIS_SAMPLE_RATE = 22050
 
-def convert_numpy_types(obj: Any) -> Any:
-    """Convert numpy types to native Python types for JSON serialization"""
-    if isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_numpy_types(item) for item in obj)
-    return obj
+# librosa's defaults for the spectral features
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MFCC = 13
+ROLL_PERCENT = 0.85
+TOP_DB = 80.0
+
+
+@lru_cache(maxsize=4)
+def _spectral_bases(sr: int, device: str) -> Tuple[torch.Tensor, ...]:
+    """Hann window, bin frequencies, mel filterbank and DCT-II matrix on device"""
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=N_FFT)
+    n_mels = mel_basis.shape[0]
+    
+    # Orthonormal DCT-II rows, as scipy's dct(type=2, norm='ortho') in librosa's MFCC
+    k = np.arange(N_MFCC)[:, None]
+    n = np.arange(n_mels)[None, :]
+    dct = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)) * np.sqrt(2.0 / n_mels)
+    dct[0] /= np.sqrt(2.0)
+    
+    return (
+        torch.hann_window(N_FFT, device=device),
+        torch.from_numpy(librosa.fft_frequencies(sr=sr, n_fft=N_FFT)).float().to(device),
+        torch.from_numpy(mel_basis).to(device),
+        torch.from_numpy(dct).float().to(device),
+    )
+
+
+def _spectral_features_gpu(y: np.ndarray, sr: int) -> Tuple[float, float, float, np.ndarray, np.ndarray]:
+    """
+    Spectral centroid, rolloff and MFCC statistics from one CUDA STFT
+    
+    Matches librosa's spectral_centroid / spectral_rolloff / mfcc defaults.
+    
+    Returns:
+        (centroid mean, centroid std, rolloff mean, MFCC means, MFCC stds)
+    """
+    window, freqs, mel_basis, dct = _spectral_bases(sr, "cuda")
+    
+    with torch.inference_mode():
+        signal = torch.from_numpy(y).to("cuda")
+        magnitude = torch.stft(
+            signal, N_FFT, HOP_LENGTH,
+            window=window, center=True, pad_mode='constant', return_complex=True
+        ).abs()
+        
+        # Centroid: magnitude-weighted mean frequency per frame
+        centroid = (freqs[:, None] * magnitude).sum(dim=0) / magnitude.sum(dim=0).clamp_min(1e-10)
+        
+        # Rolloff: first bin holding ROLL_PERCENT of the frame's energy
+        energy = magnitude.cumsum(dim=0)
+        reached = energy >= ROLL_PERCENT * energy[-1:]
+        rolloff = freqs[reached.int().argmax(dim=0)]
+        
+        # MFCC: DCT of the dB mel power spectrogram (top_db clipped)
+        mel_db = 10.0 * torch.log10((mel_basis @ magnitude.square()).clamp_min(1e-10))
+        mel_db = torch.maximum(mel_db, mel_db.max() - TOP_DB)
+        mfccs = dct @ mel_db
+        
+        stats = torch.cat([
+            torch.stack([centroid.mean(), centroid.std(unbiased=False), rolloff.mean()]),
+            mfccs.mean(dim=1),
+            mfccs.std(dim=1, unbiased=False),
+        ]).cpu().numpy()
+    
+    return stats[0], stats[1], stats[2], stats[3:3 + N_MFCC], stats[3 + N_MFCC:]
 
 
 def get_whisper_model():
@@ -105,13 +159,24 @@ class AudioProcessor:
         except Exception as e:
             raise Exception(f"Error loading audio file: {str(e)}")
     
+    @staticmethod
+    def load_audio(file_path: str) -> Tuple[np.ndarray, int]:
+        """Decode and resample once for the *_from_array analyses"""
+        return librosa.load(file_path, sr=ANALYSIS_SAMPLE_RATE)
+    
     @staticmethod
     def extract_features(file_path: str) -> Dict[str, Any]:
         """Extract audio features for analysis"""
         try:
-            # Load audio
-            y, sr = librosa.load(file_path, sr=22050)
-            
+            y, sr = AudioProcessor.load_audio(file_path)
+        except Exception as e:
+            raise Exception(f"Error extracting audio features: {str(e)}")
+        return AudioProcessor.extract_features_from_array(y, sr)
+    
+    @staticmethod
+    def extract_features_from_array(y: np.ndarray, sr: int) -> Dict[str, Any]:
+        """Extract audio features from a loaded signal"""
+        try:
             # Extract features
             features = {}
             
@@ -120,20 +185,31 @@ class AudioProcessor:
             features['zcr_mean'] = float(np.mean(zcr))
             features['zcr_std'] = float(np.std(zcr))
             
+            # Spectral features share one STFT on GPU; librosa on CPU
+            if torch.cuda.is_available():
+                (
+                    centroid_mean, centroid_std, rolloff_mean, mfcc_means, mfcc_stds
+                ) = _spectral_features_gpu(y, sr)
+            else:
+                spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)
+                centroid_mean = np.mean(spectral_centroids)
+                centroid_std = np.std(spectral_centroids)
+                rolloff_mean = np.mean(librosa.feature.spectral_rolloff(y=y, sr=sr))
+                mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=N_MFCC)
+                mfcc_means = mfccs.mean(axis=1)
+                mfcc_stds = mfccs.std(axis=1)
+            
             # Spectral Centroid
-            spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)
-            features['spectral_centroid_mean'] = float(np.mean(spectral_centroids))
-            features['spectral_centroid_std'] = float(np.std(spectral_centroids))
+            features['spectral_centroid_mean'] = float(centroid_mean)
+            features['spectral_centroid_std'] = float(centroid_std)
             
             # Spectral Rolloff
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)
-            features['spectral_rolloff_mean'] = float(np.mean(spectral_rolloff))
+            features['spectral_rolloff_mean'] = float(rolloff_mean)
             
             # MFCC (Mel-frequency cepstral coefficients)
-            mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-            for i in range(13):
-                features[f'mfcc_{i}_mean'] = float(np.mean(mfccs[i]))
-                features[f'mfcc_{i}_std'] = float(np.std(mfccs[i]))
+            for i in range(N_MFCC):
+                features[f'mfcc_{i}_mean'] = float(mfcc_means[i])
+                features[f'mfcc_{i}_std'] = float(mfcc_stds[i])
             
             # RMS Energy
             rms = librosa.feature.rms(y=y)
@@ -148,8 +224,19 @@ class AudioProcessor:
     def detect_silence_segments(file_path: str, threshold: float = 0.01) -> List[Dict[str, float]]:
         """Detect silent segments in audio"""
         try:
-            y, sr = librosa.load(file_path, sr=22050)
-            
+            y, sr = AudioProcessor.load_audio(file_path)
+        except Exception as e:
+            raise Exception(f"Error detecting silence: {str(e)}")
+        return AudioProcessor.detect_silence_from_array(y, sr, threshold)
+    
+    @staticmethod
+    def detect_silence_from_array(
+        y: np.ndarray,
+        sr: int,
+        threshold: float = 0.01
+    ) -> List[Dict[str, float]]:
+        """Detect silent segments in a loaded signal"""
+        try:
             # Calculate RMS energy
             rms = librosa.feature.rms(y=y)[0]
             
@@ -160,31 +247,16 @@ class AudioProcessor:
             hop_length = 512
             frame_duration = hop_length / sr
             
-            segments = []
-            in_silence = False
-            start_time = 0
+            # Runs of silent frames start where the padded mask steps 0 -> 1
+            # and end (exclusive) where it steps 1 -> 0
+            steps = np.diff(np.concatenate(([0], silent_frames.view(np.int8), [0])))
+            start_times = np.flatnonzero(steps == 1) * frame_duration
+            end_times = np.flatnonzero(steps == -1) * frame_duration
             
-            for i, is_silent in enumerate(silent_frames):
-                current_time = i * frame_duration
-                
-                if is_silent and not in_silence:
-                    start_time = current_time
-                    in_silence = True
-                elif not is_silent and in_silence:
-                    segments.append({
-                        'start': start_time,
-                        'end': current_time,
-                        'duration': current_time - start_time
-                    })
-                    in_silence = False
-            
-            # Close last segment if needed
-            if in_silence:
-                segments.append({
-                    'start': start_time,
-                    'end': len(silent_frames) * frame_duration,
-                    'duration': len(silent_frames) * frame_duration - start_time
-                })
+            segments = [
+                {'start': start, 'end': end, 'duration': end - start}
+                for start, end in zip(start_times.tolist(), end_times.tolist())
+            ]
             
             return segments
         except Exception as e:
@@ -194,8 +266,15 @@ class AudioProcessor:
     def analyze_audio_quality(file_path: str) -> Dict[str, Any]:
         """Analyze audio quality metrics"""
         try:
-            y, sr = librosa.load(file_path, sr=22050)
-            
+            y, _ = AudioProcessor.load_audio(file_path)
+        except Exception as e:
+            raise Exception(f"Error analyzing audio quality: {str(e)}")
+        return AudioProcessor.analyze_quality_from_array(y)
+    
+    @staticmethod
+    def analyze_quality_from_array(y: np.ndarray) -> Dict[str, Any]:
+        """Analyze audio quality metrics of a loaded signal"""
+        try:
             # Signal-to-Noise Ratio (simplified)
             signal_power = np.mean(y ** 2)
             noise_estimate = np.std(y[np.abs(y) < 0.1])  # Estimate noise from quiet parts
@@ -243,7 +322,36 @@ class SimpleTranscriber:
         }
 
 
-async def analyze_audio_file(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
+def _transcribe(file_path: str, use_ml: bool) -> Dict[str, Any]:
+    """Transcribe with Whisper if available, else a placeholder result"""
+    if use_ml:
+        whisper = get_whisper_model()
+        if whisper:
+            try:
+                transcription = whisper.transcribe(file_path)
+            except Exception as e:
+                print(f"Error in Whisper transcription: {e}")
+                transcription = {
+                    'text': '[Transcription failed]',
+                    'segments': [],
+                    'language': 'unknown',
+                    'confidence': 0.0,
+                }
+        else:
+            # Fallback transcription
+            transcription = {
+                'text': '[Whisper model not available]',
+                'segments': [],
+                'language': 'en',
+                'confidence': 0.0,
+            }
+    else:
+        transcription = {'text': '[Transcription skipped]', 'segments': []}
+    
+    return transcription
+
+
+def analyze_audio_file_sync(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
     """
     Perform complete audio analysis
     
@@ -260,42 +368,27 @@ async def analyze_audio_file(file_path: str, use_ml: bool = True) -> Dict[str, A
         - deepfake_detection: ML-based deepfake analysis
     """
     try:
-        # Get basic info
-        audio_info = AudioProcessor.get_audio_info(file_path)
-        
-        # Extract features
-        features = AudioProcessor.extract_features(file_path)
-        
-        # Analyze quality
-        quality = AudioProcessor.analyze_audio_quality(file_path)
-        
-        # Detect silence
-        silence_segments = AudioProcessor.detect_silence_segments(file_path)
-        
-        # Transcribe with ML if available
-        if use_ml:
-            whisper = get_whisper_model()
-            if whisper:
-                try:
-                    transcription = whisper.transcribe(file_path)
-                except Exception as e:
-                    print(f"Error in Whisper transcription: {e}")
-                    transcription = {
-                        'text': '[Transcription failed]',
-                        'segments': [],
-                        'language': 'unknown',
-                        'confidence': 0.0,
-                    }
-            else:
-                # Fallback transcription
-                transcription = {
-                    'text': '[Whisper model not available]',
-                    'segments': [],
-                    'language': 'en',
-                    'confidence': 0.0,
-                }
-        else:
-            transcription = {'text': '[Transcription skipped]', 'segments': []}
+        # ffprobe and Whisper (GPU, releases the GIL) run on helper threads
+        # while this thread decodes the file and computes the signal analyses
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            info_future = pool.submit(AudioProcessor.get_audio_info, file_path)
+            transcription_future = pool.submit(_transcribe, file_path, use_ml)
+            
+            # Decode once for all signal analyses
+            y, sr = AudioProcessor.load_audio(file_path)
+            
+            # Extract features
+            features = AudioProcessor.extract_features_from_array(y, sr)
+            
+            # Analyze quality
+            quality = AudioProcessor.analyze_quality_from_array(y)
+            
+            # Detect silence
+            silence_segments = AudioProcessor.detect_silence_from_array(y, sr)
+            
+            # Get basic info
+            audio_info = info_future.result()
+            transcription = transcription_future.result()
         
         # Deepfake detection with ML
         deepfake_analysis = None
@@ -317,7 +410,6 @@ async def analyze_audio_file(file_path: str, use_ml: bool = True) -> Dict[str, A
             'deepfake_detection': deepfake_analysis,
         }
         
-        # Convert numpy types to native Python types for JSON serialization
-        return convert_numpy_types(result)
+        return result
     except Exception as e:
         raise Exception(f"Audio analysis failed: {str(e)}")
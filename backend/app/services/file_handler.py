@@ -1,5 +1,5 @@
 import os
-import uuid
+import secrets
 import aiofiles
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
@@ -15,13 +15,24 @@ MAX_TEXT_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_AUDIO_SIZE = 50 * 1024 * 1024  # 50MB
 MAX_VIDEO_SIZE = 100 * 1024 * 1024  # 100MB
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 
-async def validate_file(
+
+async def save_and_validate_upload(
     file: UploadFile,
+    file_type: str,
     allowed_extensions: set,
     max_size: int
-) -> None:
-    """Validate file extension and size"""
+) -> Tuple[str, str, int]:
+    """
+    Validate and save an uploaded file in a single streaming pass
+    
+    The extension is checked up front; the size is counted while the file
+    is written in chunks, so the upload is never held in memory as a whole.
+    
+    Returns:
+        Tuple of (file_id, file_path, file_size)
+    """
     # Check file extension
     file_ext = Path(file.filename or '').suffix.lower()
     if file_ext not in allowed_extensions:
@@ -30,43 +41,31 @@ async def validate_file(
             detail=f"File type {file_ext} not allowed. Allowed types: {', '.join(allowed_extensions)}"
         )
     
-    # Check file size by reading the file
-    content = await file.read()
-    file_size = len(content)
-    
-    if file_size > max_size:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File size {file_size} exceeds maximum allowed size of {max_size} bytes"
-        )
-    
-    # Reset file pointer
-    await file.seek(0)
-
-
-async def save_upload_file(file: UploadFile, file_type: str) -> Tuple[str, str, int]:
-    """
-    Save uploaded file to disk
-    
-    Returns:
-        Tuple of (file_id, file_path, file_size)
-    """
     # Create upload directory if it doesn't exist
     upload_dir = Path(settings.UPLOAD_DIR) / file_type
     upload_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate unique filename
-    file_id = str(uuid.uuid4())
-    file_ext = Path(file.filename or '').suffix
-    filename = f"{file_id}{file_ext}"
-    file_path = upload_dir / filename
+    file_id = secrets.token_urlsafe(16)
+    file_path = upload_dir / f"{file_id}{Path(file.filename or '').suffix}"
     
-    # Save file
-    content = await file.read()
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    # Stream to disk, aborting as soon as the size limit is exceeded
+    file_size = 0
+    try:
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File size exceeds maximum allowed size of {max_size} bytes"
+                    )
+                await f.write(chunk)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
     
-    return file_id, str(file_path), len(content)
+    return file_id, str(file_path), file_size
 
 
 def get_file_type_from_extension(filename: str) -> str:
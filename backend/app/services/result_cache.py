@@ -0,0 +1,47 @@
+"""In-process cache of serialized analysis results"""
+from typing import Optional
+
+import orjson
+from cachetools import TTLCache
+from fastapi import Response
+
+from app.core.config import settings
+from app.schemas.analysis import AnalysisResponse, AnalysisStatus, FileType
+
+# Only terminal records are cached: they never change again, while a
+# PROCESSING record must be re-read until the worker finishes it
+_TERMINAL_STATUSES = {AnalysisStatus.COMPLETED, AnalysisStatus.FAILED}
+
+# Lets reverse proxies collapse frontend polling on finished analyses
+_COMPLETED_HEADERS = {"Cache-Control": "public, max-age=5"}
+
+# Accessed only from the event loop thread, so no locking is needed
+_result_cache: TTLCache = TTLCache(
+    maxsize=settings.RESULT_CACHE_SIZE,
+    ttl=settings.RESULT_CACHE_TTL_SECONDS,
+)
+
+
+def _build_response(body: bytes, status: AnalysisStatus) -> Response:
+    headers = _COMPLETED_HEADERS if status == AnalysisStatus.COMPLETED else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def get_cached_result(file_type: FileType, analysis_id: str) -> Optional[Response]:
+    """Return the cached response for a finished analysis, if any"""
+    cached = _result_cache.get((file_type, analysis_id))
+    if cached is None:
+        return None
+    
+    body, status = cached
+    return _build_response(body, status)
+
+
+def result_response(analysis: AnalysisResponse) -> Response:
+    """Serialize an analysis result, caching it once it is final"""
+    body = orjson.dumps(analysis.model_dump(mode="json"))
+    
+    if analysis.status in _TERMINAL_STATUSES:
+        _result_cache[(analysis.file_type, analysis.id)] = (body, analysis.status)
+    
+    return _build_response(body, analysis.status)
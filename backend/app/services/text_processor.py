@@ -1,32 +1,105 @@
 import re
 import string
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 import PyPDF2
 import docx
-import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
 # Import ML model (lazy load to avoid startup delays)
 _text_ml_model = None
 
 
-def convert_numpy_types(obj: Any) -> Any:
-    """Convert numpy types to native Python types for JSON serialization"""
-    if isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_numpy_types(item) for item in obj)
-    return obj
+def _any_phrase_re(phrases: List[str]) -> "re.Pattern[str]":
+    """One compiled alternation that finds any of the phrases in a single scan"""
+    return re.compile('|'.join(map(re.escape, phrases)))
+
+
+# Manipulation indicator vocabularies (matched as substrings of lowercased text)
+_MANIPULATION_PHRASES = {
+    'sensational_language': [
+        'shocking', 'unbelievable', 'explosive', 'bombshell',
+        'devastating', 'catastrophic', 'miracle', 'breaking'
+    ],
+    'emotional_manipulation': [
+        'terrifying', 'horrifying', 'outrageous', 'disgusting',
+        'infuriating', 'heart-breaking', 'tragic'
+    ],
+    'conspiracy_language': [
+        'cover-up', 'conspiracy', 'they don\'t want you to know',
+        'hidden truth', 'wake up', 'mainstream media lies'
+    ],
+}
+
+
+def _build_phrase_automaton():
+    """Aho-Corasick automaton mapping each phrase to its indicator"""
+    automaton = ahocorasick.Automaton()
+    for indicator, phrases in _MANIPULATION_PHRASES.items():
+        for phrase in phrases:
+            automaton.add_word(phrase, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+_phrase_automaton = _build_phrase_automaton() if ahocorasick is not None else None
+
+# Without pyahocorasick: one compiled alternation per indicator
+_PHRASE_RES = {
+    indicator: _any_phrase_re(phrases)
+    for indicator, phrases in _MANIPULATION_PHRASES.items()
+}
+
+
+def _find_phrase_indicators(text_lower: str) -> Set[str]:
+    """Indicators with at least one vocabulary phrase in the lowercased text"""
+    if _phrase_automaton is None:
+        return {
+            indicator for indicator, pattern in _PHRASE_RES.items()
+            if pattern.search(text_lower)
+        }
+    
+    # One scan finds every (also overlapping) match; stop once all are seen
+    found = set()
+    for _, indicator in _phrase_automaton.iter(text_lower):
+        found.add(indicator)
+        if len(found) == len(_MANIPULATION_PHRASES):
+            break
+    return found
+
+
+# Keywords that often indicate claims
+_CLAIM_RE = _any_phrase_re([
+    'according to', 'studies show', 'research indicates',
+    'experts say', 'scientists found', 'data reveals',
+    'reports confirm', 'evidence suggests', 'statistics show'
+])
+
+# Sentiment lexicons (matched against lowercased whole words)
+_POSITIVE_WORDS = frozenset([
+    'good', 'great', 'excellent', 'wonderful', 'amazing', 'fantastic',
+    'positive', 'beneficial', 'helpful', 'effective', 'successful'
+])
+_NEGATIVE_WORDS = frozenset([
+    'bad', 'terrible', 'horrible', 'awful', 'poor', 'negative',
+    'harmful', 'dangerous', 'ineffective', 'failed', 'wrong'
+])
+
+# URLs, email addresses and special characters (punctuation is kept)
+_CLEAN_RE = re.compile(r'http\S+|www.\S+|\S+@\S+|[^\w\s.,!?;:\-\'"()]+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
 
 
 def get_text_ml_model():
@@ -46,27 +119,39 @@ class TextExtractor:
     """Extract text from various file formats"""
     
     @staticmethod
-    async def extract_from_txt(file_path: str) -> str:
+    def extract_from_txt(file_path: str) -> str:
         """Extract text from .txt file"""
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             return f.read()
     
     @staticmethod
-    async def extract_from_pdf(file_path: str) -> str:
+    def extract_from_pdf(file_path: str) -> str:
         """Extract text from .pdf file"""
         text = []
         try:
-            with open(file_path, 'rb') as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                for page in pdf_reader.pages:
-                    text.append(page.extract_text())
+            if pdfium is not None:
+                # PDFium extracts text in C, many times faster than PyPDF2
+                pdf = pdfium.PdfDocument(file_path)
+                try:
+                    for page in pdf:
+                        text_page = page.get_textpage()
+                        text.append(text_page.get_text_range())
+                        text_page.close()
+                        page.close()
+                finally:
+                    pdf.close()
+            else:
+                with open(file_path, 'rb') as f:
+                    pdf_reader = PyPDF2.PdfReader(f)
+                    for page in pdf_reader.pages:
+                        text.append(page.extract_text())
         except Exception as e:
             raise Exception(f"Error extracting PDF: {str(e)}")
         
         return '\n'.join(text)
     
     @staticmethod
-    async def extract_from_docx(file_path: str) -> str:
+    def extract_from_docx(file_path: str) -> str:
         """Extract text from .docx file"""
         try:
             doc = docx.Document(file_path)
@@ -78,20 +163,33 @@ class TextExtractor:
             raise Exception(f"Error extracting DOCX: {str(e)}")
     
     @staticmethod
-    async def extract_text(file_path: str) -> str:
+    def extract_text(file_path: str) -> str:
         """Extract text from file based on extension"""
         file_ext = Path(file_path).suffix.lower()
         
         if file_ext == '.txt':
-            return await TextExtractor.extract_from_txt(file_path)
+            return TextExtractor.extract_from_txt(file_path)
         elif file_ext == '.pdf':
-            return await TextExtractor.extract_from_pdf(file_path)
+            return TextExtractor.extract_from_pdf(file_path)
         elif file_ext in ['.docx', '.doc']:
-            return await TextExtractor.extract_from_docx(file_path)
+            return TextExtractor.extract_from_docx(file_path)
         else:
             raise ValueError(f"Unsupported file type: {file_ext}")
 
 
+@dataclass
+class TokenizedText:
+    """A cleaned text split once, shared by all the analyzers"""
+    text: str
+    words: List[str]
+    lower_text: str
+    lower_words: List[str]
+    sentences: List[str]
+    upper_count: int
+    exclamation_count: int
+    question_count: int
+
+
 class TextPreprocessor:
     """Preprocess text for analysis"""
     
@@ -101,14 +199,8 @@ class TextPreprocessor:
         # Remove extra whitespace
         text = ' '.join(text.split())
         
-        # Remove URLs
-        text = re.sub(r'http\S+|www.\S+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove special characters (keep punctuation)
-        text = re.sub(r'[^\w\s.,!?;:\-\'"()]', '', text)
+        # Remove URLs, email addresses and special characters in one pass
+        text = _CLEAN_RE.sub('', text)
         
         return text.strip()
     
@@ -116,49 +208,44 @@ class TextPreprocessor:
     def split_sentences(text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting (can be improved with NLTK)
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_END_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     @staticmethod
-    def extract_claims(text: str) -> List[str]:
+    def tokenize(text: str) -> TokenizedText:
+        """Split, lowercase and count a cleaned text in one place"""
+        lower_text = text.lower()
+        return TokenizedText(
+            text=text,
+            words=text.split(),
+            lower_text=lower_text,
+            lower_words=lower_text.split(),
+            sentences=TextPreprocessor.split_sentences(text),
+            upper_count=sum(map(str.isupper, text)),
+            exclamation_count=text.count('!'),
+            question_count=text.count('?'),
+        )
+    
+    @staticmethod
+    def extract_claims(tokens: TokenizedText) -> List[str]:
         """Extract potential claims from text"""
-        sentences = TextPreprocessor.split_sentences(text)
-        
-        # Keywords that often indicate claims
-        claim_indicators = [
-            'according to', 'studies show', 'research indicates',
-            'experts say', 'scientists found', 'data reveals',
-            'reports confirm', 'evidence suggests', 'statistics show'
+        return [
+            sentence for sentence in tokens.sentences
+            if _CLAIM_RE.search(sentence.lower())
         ]
-        
-        claims = []
-        for sentence in sentences:
-            lower_sentence = sentence.lower()
-            if any(indicator in lower_sentence for indicator in claim_indicators):
-                claims.append(sentence)
-        
-        return claims
 
 
 class TextAnalyzer:
     """Analyze text for various features"""
     
     @staticmethod
-    def calculate_sentiment(text: str) -> Dict[str, Any]:
+    def calculate_sentiment(tokens: TokenizedText) -> Dict[str, Any]:
         """Calculate sentiment (simple version, to be replaced with ML model)"""
         # Simple sentiment based on word lists (placeholder)
-        positive_words = set([
-            'good', 'great', 'excellent', 'wonderful', 'amazing', 'fantastic',
-            'positive', 'beneficial', 'helpful', 'effective', 'successful'
-        ])
-        negative_words = set([
-            'bad', 'terrible', 'horrible', 'awful', 'poor', 'negative',
-            'harmful', 'dangerous', 'ineffective', 'failed', 'wrong'
-        ])
-        
-        words = text.lower().split()
-        pos_count = sum(1 for word in words if word in positive_words)
-        neg_count = sum(1 for word in words if word in negative_words)
+        # One counting pass over the words, then a lookup per lexicon entry
+        word_counts = Counter(tokens.lower_words)
+        pos_count = sum(word_counts[word] for word in _POSITIVE_WORDS)
+        neg_count = sum(word_counts[word] for word in _NEGATIVE_WORDS)
         
         if pos_count > neg_count:
             sentiment = 'positive'
@@ -178,72 +265,61 @@ class TextAnalyzer:
         }
     
     @staticmethod
-    def detect_manipulation_indicators(text: str) -> List[str]:
+    def detect_manipulation_indicators(tokens: TokenizedText) -> List[str]:
         """Detect linguistic patterns that may indicate manipulation"""
         indicators = []
-        text_lower = text.lower()
+        found = _find_phrase_indicators(tokens.lower_text)
         
         # Check for sensationalism
-        sensational_words = [
-            'shocking', 'unbelievable', 'explosive', 'bombshell',
-            'devastating', 'catastrophic', 'miracle', 'breaking'
-        ]
-        if any(word in text_lower for word in sensational_words):
+        if 'sensational_language' in found:
             indicators.append('sensational_language')
         
         # Check for emotional manipulation
-        emotional_words = [
-            'terrifying', 'horrifying', 'outrageous', 'disgusting',
-            'infuriating', 'heart-breaking', 'tragic'
-        ]
-        if any(word in text_lower for word in emotional_words):
+        if 'emotional_manipulation' in found:
             indicators.append('emotional_manipulation')
         
         # Check for ALL CAPS (excessive emphasis)
-        if sum(1 for c in text if c.isupper()) / max(len(text), 1) > 0.3:
+        if tokens.upper_count / max(len(tokens.text), 1) > 0.3:
             indicators.append('excessive_capitalization')
         
         # Check for excessive punctuation
-        if text.count('!') > 5 or text.count('?') > 5:
+        if tokens.exclamation_count > 5 or tokens.question_count > 5:
             indicators.append('excessive_punctuation')
         
         # Check for conspiracy language
-        conspiracy_terms = [
-            'cover-up', 'conspiracy', 'they don\'t want you to know',
-            'hidden truth', 'wake up', 'mainstream media lies'
-        ]
-        if any(term in text_lower for term in conspiracy_terms):
+        if 'conspiracy_language' in found:
             indicators.append('conspiracy_language')
         
         return indicators
     
     @staticmethod
-    def extract_simple_entities(text: str) -> List[Dict[str, str]]:
+    def extract_simple_entities(tokens: TokenizedText) -> List[Dict[str, str]]:
         """Simple entity extraction (to be replaced with spaCy)"""
-        entities = []
+        # Extract potential names (capitalized words not at the start of a
+        # sentence), stopping once the first 10 are found
+        words = tokens.words
+        candidates = (
+            word for previous, word in zip(words, islice(words, 1, None))
+            if len(word) > 1 and word[0].isupper() and not previous.endswith('.')
+        )
         
-        # Extract potential names (capitalized words)
-        words = text.split()
-        for i, word in enumerate(words):
-            if word and word[0].isupper() and len(word) > 1:
-                # Check if it's not at the start of a sentence
-                if i > 0 and not words[i-1].endswith('.'):
-                    entities.append({
-                        'text': word,
-                        'type': 'PERSON_OR_ORG',
-                        'confidence': 0.5
-                    })
-        
-        return entities[:10]  # Limit to 10 entities
+        return [
+            {
+                'text': word,
+                'type': 'PERSON_OR_ORG',
+                'confidence': 0.5
+            }
+            for word in islice(candidates, 10)  # Limit to 10 entities
+        ]
     
     @staticmethod
-    def calculate_readability(text: str) -> Dict[str, float]:
+    def calculate_readability(tokens: TokenizedText) -> Dict[str, float]:
         """Calculate readability metrics"""
-        words = text.split()
-        sentences = TextPreprocessor.split_sentences(text)
+        words = tokens.words
+        sentences = tokens.sentences
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / max(len(words), 1)
+        avg_word_length = sum(map(len, words)) / max(len(words), 1)
         
         # Average sentence length
         avg_sentence_length = len(words) / max(len(sentences), 1)
@@ -264,7 +340,7 @@ class TextAnalyzer:
         }
 
 
-async def analyze_text_file(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
+def analyze_text_file_sync(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
     """
     Perform complete text analysis
     
@@ -284,23 +360,24 @@ async def analyze_text_file(file_path: str, use_ml: bool = True) -> Dict[str, An
         - ml_explanation: Human-readable explanation
     """
     # Extract text
-    text = await TextExtractor.extract_text(file_path)
+    text = TextExtractor.extract_text(file_path)
     
-    # Clean text
+    # Clean text and split it once for every analyzer
     clean_text = TextPreprocessor.clean_text(text)
-    sentences = TextPreprocessor.split_sentences(clean_text)
+    tokens = TextPreprocessor.tokenize(clean_text)
+    sentences = tokens.sentences
     
     # Analyze
     result = {
         'text': clean_text[:1000],  # First 1000 chars for preview
         'full_text_length': len(text),
-        'word_count': len(clean_text.split()),
+        'word_count': len(tokens.words),
         'sentence_count': len(sentences),
-        'sentiment': TextAnalyzer.calculate_sentiment(clean_text),
-        'claims': TextPreprocessor.extract_claims(clean_text),
-        'entities': TextAnalyzer.extract_simple_entities(clean_text),
-        'manipulation_indicators': TextAnalyzer.detect_manipulation_indicators(clean_text),
-        'readability': TextAnalyzer.calculate_readability(clean_text),
+        'sentiment': TextAnalyzer.calculate_sentiment(tokens),
+        'claims': TextPreprocessor.extract_claims(tokens),
+        'entities': TextAnalyzer.extract_simple_entities(tokens),
+        'manipulation_indicators': TextAnalyzer.detect_manipulation_indicators(tokens),
+        'readability': TextAnalyzer.calculate_readability(tokens),
     }
     
     # Add ML prediction if requested
@@ -311,7 +388,7 @@ async def analyze_text_file(file_path: str, use_ml: bool = True) -> Dict[str, An
                 # Use meaningful sample for analysis
                 text_sample = ' '.join(sentences[:10]) if sentences else clean_text[:2000]
                 ml_prediction = ml_model.predict(text_sample, return_features=True)
-                ml_explanation = ml_model.get_explanation(text_sample)
+                ml_explanation = ml_model.get_explanation(text_sample, ml_prediction)
                 
                 result['ml_prediction'] = ml_prediction
                 result['ml_explanation'] = ml_explanation
@@ -323,5 +400,4 @@ async def analyze_text_file(file_path: str, use_ml: bool = True) -> Dict[str, An
             result['ml_prediction'] = None
             result['ml_explanation'] = None
     
-    # Convert numpy types to native Python types for JSON serialization
-    return convert_numpy_types(result)
+    return result
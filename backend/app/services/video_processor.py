@@ -1,31 +1,118 @@
 import subprocess
 import json
+import queue
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Tuple, Optional
+from app.core.frame_pool import get_frame_pool
 
 # Lazy load ML models
 _video_deepfake_detector = None
 
+# Frames decoded ahead of the analysis loop (bounded for back-pressure)
+FRAME_PREFETCH = 4
+_END_OF_FRAMES = object()
 
-def convert_numpy_types(obj: Any) -> Any:
-    """Convert numpy types to native Python types for JSON serialization"""
-    if isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_numpy_types(item) for item in obj)
-    return obj
+# Scene change detection compares the first frame and up to 501 more,
+# downscaled (the cuts it looks for are large-scale brightness changes)
+SCENE_MAX_FRAMES = 502
+SCENE_SIZE = (160, 90)
+
+# Haar cascades are parsed once per thread (instances are not shareable)
+_cascade_local = threading.local()
+
+
+def _face_cascade() -> cv2.CascadeClassifier:
+    """This thread's frontal face cascade"""
+    cascade = getattr(_cascade_local, 'face', None)
+    if cascade is None:
+        cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        )
+        _cascade_local.face = cascade
+    return cascade
+
+
+def _open_capture(file_path: str) -> cv2.VideoCapture:
+    """
+    Open a video for decoding on a hardware decoder when one is available
+    
+    FFmpeg picks NVDEC, VA-API, D3D11 or similar if the build supports it
+    and falls back to software decoding otherwise; frames still come back
+    as BGR arrays.
+    """
+    cap = cv2.VideoCapture(
+        file_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if not cap.isOpened():
+        cap = cv2.VideoCapture(file_path)
+    return cap
+
+
+def _ffmpeg_frames(
+    file_path: str,
+    frame_indices: np.ndarray,
+    width: int,
+    height: int
+) -> Iterator[np.ndarray]:
+    """
+    Decode just the given frame indices in one sequential ffmpeg pass
+    
+    Yields BGR frames in index order (a repeated index repeats its frame),
+    or nothing if ffmpeg cannot be started.
+    """
+    indices, repeats = np.unique(frame_indices, return_counts=True)
+    select = '+'.join(f'eq(n,{idx})' for idx in indices)
+    cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-v', 'quiet',
+        '-i', file_path,
+        '-vf', f'select={select},scale={width}:{height}',
+        '-vsync', 'vfr',
+        '-f', 'rawvideo',
+        '-pix_fmt', 'bgr24',
+        '-',
+    ]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return
+    
+    try:
+        for count in repeats:
+            buffer = bytearray(width * height * 3)
+            if proc.stdout.readinto(buffer) < len(buffer):
+                break
+            frame = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+            yield frame
+            for _ in range(count - 1):
+                yield frame.copy()
+    finally:
+        # The remaining frames are not needed; stop decoding them
+        proc.stdout.close()
+        proc.kill()
+        proc.wait()
+
+
+def _parse_rate(rate: str) -> float:
+    """Parse an ffprobe rate such as '30000/1001' (0.0 for a zero denominator)"""
+    numerator, _, denominator = rate.partition('/')
+    if not denominator:
+        return float(numerator)
+    denominator = int(denominator)
+    return int(numerator) / denominator if denominator else 0.0
+
+
+def _first_value(values) -> float:
+    """First element of an OpenCV result, which is a UMat for UMat inputs"""
+    if isinstance(values, cv2.UMat):
+        values = values.get()
+    return float(np.ravel(values)[0])
 
 
 def get_video_deepfake_detector():
@@ -72,7 +159,7 @@ class VideoProcessor:
                         'bit_rate': int(data['format'].get('bit_rate', 0)),
                         'width': int(video_stream.get('width', 0)),
                         'height': int(video_stream.get('height', 0)),
-                        'fps': eval(video_stream.get('r_frame_rate', '0/1')),
+                        'fps': _parse_rate(video_stream.get('r_frame_rate', '0/1')),
                         'codec': video_stream.get('codec_name', 'unknown'),
                         'format': data['format'].get('format_name', 'unknown'),
                     }
@@ -120,31 +207,82 @@ class VideoProcessor:
         Returns:
             List of frame arrays
         """
-        cap = cv2.VideoCapture(file_path)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        return list(VideoProcessor.iter_frames(file_path, num_frames, method))
+    
+    @staticmethod
+    def iter_frames(
+        file_path: str,
+        num_frames: int = 10,
+        method: str = 'uniform',
+        prefetch: int = FRAME_PREFETCH
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield frames as extract_frames would, decoded on a reader thread
         
-        frames = []
+        The reader stays up to `prefetch` frames ahead, so seeking and
+        decoding overlap with whatever the caller does with each frame.
+        """
+        frame_queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
         
-        if method == 'uniform':
-            # Extract evenly spaced frames
-            frame_indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
-            
-            for idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-                ret, frame = cap.read()
-                if ret:
-                    frames.append(frame)
-        else:
-            # Extract first N frames (simple approach)
-            for i in range(min(num_frames, total_frames)):
-                ret, frame = cap.read()
-                if ret:
-                    frames.append(frame)
+        def put(item) -> bool:
+            # Give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def reader():
+            cap = _open_capture(file_path)
+            try:
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                
+                if method == 'uniform':
+                    # Extract evenly spaced frames
+                    frame_indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
+                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                    
+                    # All of them in one sequential ffmpeg decode; seeking
+                    # re-decodes from the previous keyframe for every frame
+                    sent = 0
+                    if total_frames > 0 and width > 0 and height > 0:
+                        piped = _ffmpeg_frames(file_path, frame_indices, width, height)
+                        try:
+                            for frame in piped:
+                                if not put(frame):
+                                    return
+                                sent += 1
+                        finally:
+                            piped.close()
+                    
+                    # Seek per frame if ffmpeg is unavailable or produced nothing
+                    if sent == 0:
+                        for idx in frame_indices:
+                            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                            ret, frame = cap.read()
+                            if ret and not put(frame):
+                                return
                 else:
-                    break
+                    # Extract first N frames (simple approach)
+                    for i in range(min(num_frames, total_frames)):
+                        ret, frame = cap.read()
+                        if not ret or not put(frame):
+                            break
+            finally:
+                cap.release()
+                put(_END_OF_FRAMES)
         
-        cap.release()
-        return frames
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            yield from iter(frame_queue.get, _END_OF_FRAMES)
+        finally:
+            stop.set()
+            thread.join()
     
     @staticmethod
     def detect_faces(frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
@@ -154,16 +292,11 @@ class VideoProcessor:
         Returns:
             List of (x, y, width, height) tuples for each face
         """
-        # Load Haar Cascade classifier
-        face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
-        
         # Convert to grayscale
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         
         # Detect faces
-        faces = face_cascade.detectMultiScale(
+        faces = _face_cascade().detectMultiScale(
             gray,
             scaleFactor=1.1,
             minNeighbors=5,
@@ -175,20 +308,23 @@ class VideoProcessor:
     @staticmethod
     def analyze_frame_quality(frame: np.ndarray) -> Dict[str, float]:
         """Analyze quality metrics of a single frame"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # UMat routes the kernels through OpenCL when a device is available
+        # and runs them on the CPU as before otherwise
+        gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
         
-        # Sharpness (Laplacian variance)
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+        # Sharpness (Laplacian variance); the 3x3 Laplacian of uint8 pixels
+        # lies within +-1020, so int16 holds it exactly
+        _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+        laplacian_var = _first_value(laplacian_std) ** 2
         
-        # Brightness (mean pixel value)
-        brightness = np.mean(gray)
+        # Brightness (mean pixel value) and contrast (standard deviation)
+        brightness, contrast = map(_first_value, cv2.meanStdDev(gray))
         
-        # Contrast (standard deviation)
-        contrast = np.std(gray)
-        
-        # Noise estimate (using high-frequency components)
-        noise = np.std(gray - cv2.GaussianBlur(gray, (5, 5), 0))
+        # Noise estimate (using high-frequency components); the low byte of
+        # the signed difference is the uint8 wrap-around difference
+        diff = cv2.subtract(gray, cv2.GaussianBlur(gray, (5, 5), 0), dtype=cv2.CV_16S)
+        _, noise = cv2.meanStdDev(cv2.bitwise_and(diff, 255))
+        noise = _first_value(noise)
         
         return {
             'sharpness': float(laplacian_var),
@@ -205,45 +341,38 @@ class VideoProcessor:
         Returns:
             List of frame indices where scene changes occur
         """
-        cap = cv2.VideoCapture(file_path)
-        scene_changes = []
+        # Grayscale thumbnails of the first frames, written in place
+        stack = np.empty(
+            (SCENE_MAX_FRAMES, SCENE_SIZE[1], SCENE_SIZE[0]), dtype=np.uint8
+        )
+        count = 0
         
-        ret, prev_frame = cap.read()
-        if not ret:
+        cap = _open_capture(file_path)
+        try:
+            while count < SCENE_MAX_FRAMES:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                
+                small = cv2.resize(frame, SCENE_SIZE, interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=stack[count])
+                count += 1
+        finally:
             cap.release()
-            return scene_changes
-        
-        prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-        frame_idx = 0
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            frame_idx += 1
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Calculate difference
-            diff = cv2.absdiff(gray, prev_gray)
-            mean_diff = np.mean(diff)
-            
-            if mean_diff > threshold:
-                scene_changes.append(frame_idx)
-            
-            prev_gray = gray
-            
-            # Limit to prevent long processing
-            if frame_idx > 500:
-                break
+        if count < 2:
+            return []
         
-        cap.release()
-        return scene_changes
+        # Mean absolute difference between consecutive frames in one pass
+        diffs = np.abs(
+            np.subtract(stack[1:count], stack[:count - 1], dtype=np.int16)
+        ).mean(axis=(1, 2))
+        return (np.flatnonzero(diffs > threshold) + 1).tolist()
     
     @staticmethod
     def generate_thumbnail(file_path: str, output_path: str, time_sec: float = 1.0) -> str:
         """Generate thumbnail image from video"""
-        cap = cv2.VideoCapture(file_path)
+        cap = _open_capture(file_path)
         
         # Set position to specified time
         fps = cap.get(cv2.CAP_PROP_FPS)
@@ -267,7 +396,7 @@ class VideoProcessor:
         raise Exception("Could not generate thumbnail")
 
 
-async def analyze_video_file(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
+def analyze_video_file_sync(file_path: str, use_ml: bool = True) -> Dict[str, Any]:
     """
     Perform complete video analysis
     
@@ -289,17 +418,26 @@ async def analyze_video_file(file_path: str, use_ml: bool = True) -> Dict[str, A
         # Get basic info
         video_info = VideoProcessor.get_video_info(file_path)
         
-        # Extract frames
-        frames = VideoProcessor.extract_frames(file_path, num_frames=10)
+        # Analyze each frame's quality on the pool as soon as it is decoded
+        pool = get_frame_pool()
+        frames = []
+        quality_futures = []
+        
+        for frame in VideoProcessor.iter_frames(file_path, num_frames=10):
+            frames.append(frame)
+            quality_futures.append(pool.submit(VideoProcessor.analyze_frame_quality, frame))
+        
+        # Detect faces in all frames with one batched DNN pass when the
+        # detector has its face network, else per frame with the Haar cascade
+        detector = get_video_deepfake_detector() if use_ml else None
+        if frames and detector and detector.face_net is not None:
+            frame_faces = [boxes.tolist() for boxes in detector.detect_faces_batch(frames)]
+        else:
+            frame_faces = list(pool.map(VideoProcessor.detect_faces, frames))
         
-        # Analyze each frame
         total_faces = 0
         face_frames = []
-        quality_metrics_list = []
-        
-        for idx, frame in enumerate(frames):
-            # Detect faces
-            faces = VideoProcessor.detect_faces(frame)
+        for idx, faces in enumerate(frame_faces):
             if len(faces) > 0:
                 total_faces += len(faces)
                 face_frames.append({
@@ -307,10 +445,8 @@ async def analyze_video_file(file_path: str, use_ml: bool = True) -> Dict[str, A
                     'face_count': len(faces),
                     'face_locations': faces,
                 })
-            
-            # Analyze quality
-            quality = VideoProcessor.analyze_frame_quality(frame)
-            quality_metrics_list.append(quality)
+        
+        quality_metrics_list = [future.result() for future in quality_futures]
         
         # Calculate average quality
         avg_quality = {
@@ -335,7 +471,6 @@ async def analyze_video_file(file_path: str, use_ml: bool = True) -> Dict[str, A
         
         # Add ML-based deepfake detection
         if use_ml:
-            detector = get_video_deepfake_detector()
             if detector:
                 try:
                     # Run deepfake detection
@@ -355,7 +490,6 @@ async def analyze_video_file(file_path: str, use_ml: bool = True) -> Dict[str, A
                 result['deepfake_detection'] = None
                 result['temporal_analysis'] = None
         
-        # Convert numpy types to native Python types for JSON serialization
-        return convert_numpy_types(result)
+        return result
     except Exception as e:
         raise Exception(f"Video analysis failed: {str(e)}")
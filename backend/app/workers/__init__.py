@@ -0,0 +1,44 @@
+"""
+Background workers for analysis jobs
+
+The broker is configured here so it is in place before any actor module
+is imported, by both the API (to enqueue) and ``dramatiq app.workers.tasks``.
+"""
+import dramatiq
+from dramatiq.brokers.redis import RedisBroker
+
+from app.core.config import settings
+
+
+class ModelWarmup(dramatiq.Middleware):
+    """
+    Load the ML models as each worker process boots
+    
+    Otherwise the first job of every process stalls for the model loads.
+    Only worker processes boot, so the API (which just enqueues) is unaffected.
+    """
+    
+    def after_process_boot(self, broker):
+        from app.ml import set_gpu_memory_budget
+        
+        # Before any model loads, preloaded or lazily on a first job
+        set_gpu_memory_budget(settings.WORKER_PROCESSES)
+        
+        if not settings.WORKER_PRELOAD_MODELS:
+            return
+        
+        from app.services.text_processor import get_text_ml_model
+        from app.services.audio_processor import get_whisper_model, get_deepfake_detector
+        from app.services.video_processor import get_video_deepfake_detector
+        
+        get_text_ml_model()
+        get_deepfake_detector()
+        get_video_deepfake_detector()
+        whisper = get_whisper_model()
+        if whisper:
+            whisper.warm_up()
+
+
+broker = RedisBroker(url=settings.REDIS_URL)
+broker.add_middleware(ModelWarmup())
+dramatiq.set_broker(broker)
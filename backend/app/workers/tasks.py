@@ -0,0 +1,201 @@
+"""
+Dramatiq actors for text, audio and video analysis
+
+Run with: dramatiq app.workers.tasks -p 4 -t 8
+"""
+from datetime import datetime
+
+import dramatiq
+import numpy as np
+
+from app.workers import broker  # noqa: F401  (configures the broker)
+from app.services.analysis_store import get_sync_analysis_store
+from app.services.text_processor import analyze_text_file_sync
+from app.services.audio_processor import analyze_audio_file_sync
+from app.services.video_processor import analyze_video_file_sync
+from app.schemas.analysis import AnalysisStatus, FileType, VideoAnalysisResult
+
+# Bound once to skip the enum attribute lookups per job
+_COMPLETED = AnalysisStatus.COMPLETED
+_FAILED = AnalysisStatus.FAILED
+_TEXT = FileType.TEXT
+_AUDIO = FileType.AUDIO
+_VIDEO = FileType.VIDEO
+
+# Audio scoring: SNR tiers (< 10 dB, < 20 dB, otherwise) and their penalties
+SNR_BINS_DB = np.array([10, 20])
+SNR_PENALTIES = np.array([15, 5, 0])
+CLIPPING_PENALTY = 20
+
+# Video scoring: metrics below these thresholds are flagged
+# (sharpness, negated scene change rate, width, height)
+VIDEO_THRESHOLDS = np.array([50, -5, 640, 480])
+# Per flag: low quality, high scene change rate, low resolution
+VIDEO_PENALTIES = np.array([10.0, 15.0, 5.0])
+VIDEO_CONFIDENCE_GAINS = np.array([0.05, 0.1, 0.0])
+VIDEO_INDICATORS = (
+    "Low video quality detected",
+    "High scene change rate",
+    "Low resolution video",
+)
+
+
+# Failures are recorded as FAILED in the store, so a retry would only
+# repeat the same expensive inference
+@dramatiq.actor(max_retries=0)
+def process_text_analysis(file_id: str, file_path: str):
+    """Process text analysis"""
+    store = get_sync_analysis_store()
+    try:
+        # Perform analysis with ML
+        result = analyze_text_file_sync(file_path, use_ml=True)
+        
+        # Calculate fake news score
+        # Prioritize ML prediction if available, otherwise use rule-based
+        if result.get('ml_prediction'):
+            ml_pred = result['ml_prediction']
+            # Convert fake probability to credibility score (inverse)
+            fake_prob = ml_pred.get('fake_probability', 0.5)
+            score = (1 - fake_prob) * 100  # 0% fake = 100% credible
+            confidence = ml_pred.get('confidence', 0.5)
+        else:
+            # Fallback to rule-based scoring
+            manipulation_count = len(result['manipulation_indicators'])
+            base_score = 100 - (manipulation_count * 15)
+            score = max(10, min(100, base_score))
+            confidence = 0.6
+        
+        # Store result
+        store.set(_TEXT, file_id, {
+            'status': _COMPLETED,
+            'completed_at': datetime.now(),
+            'credibility_score': score,
+            'confidence': confidence,
+            'result_data': result,
+        })
+    except Exception as e:
+        store.set(_TEXT, file_id, {
+            'status': _FAILED,
+            'completed_at': datetime.now(),
+            'error': str(e),
+        })
+
+
+@dramatiq.actor(max_retries=0)
+def process_audio_analysis(file_id: str, file_path: str):
+    """Process audio analysis"""
+    store = get_sync_analysis_store()
+    try:
+        # Perform analysis
+        result = analyze_audio_file_sync(file_path)
+        
+        # Calculate authenticity score based on quality metrics
+        quality = result['quality']
+        
+        # Simple scoring based on audio quality indicators
+        # Lower clipping and higher SNR = more authentic
+        snr_tier = np.searchsorted(SNR_BINS_DB, quality.get('snr_db', 0), side='right')
+        base_score = (
+            100
+            - CLIPPING_PENALTY * bool(quality.get('has_significant_clipping'))
+            - SNR_PENALTIES[snr_tier]
+        )
+        
+        score = max(10, min(100, base_score))
+        
+        # Store result
+        store.set(_AUDIO, file_id, {
+            'status': _COMPLETED,
+            'completed_at': datetime.now(),
+            'credibility_score': score,
+            'confidence': 0.70,
+            'result_data': result,
+        })
+    except Exception as e:
+        store.set(_AUDIO, file_id, {
+            'status': _FAILED,
+            'completed_at': datetime.now(),
+            'error': str(e),
+        })
+
+
+@dramatiq.actor(max_retries=0)
+def process_video_analysis(analysis_id: str, file_path: str, file_name: str):
+    """Process video analysis"""
+    store = get_sync_analysis_store()
+    try:
+        # Analyze video
+        analysis_data = analyze_video_file_sync(file_path)
+        
+        # Calculate authenticity score based on various factors
+        video_info = analysis_data['video_info']
+        quality = analysis_data['quality_metrics']
+        scene_change_rate = analysis_data['scene_change_count'] / max(video_info.get('duration', 1), 1)
+        
+        # Flag low quality (might indicate manipulation), excessive scene
+        # changes (might indicate splicing) and low resolution in one pass
+        below = np.array([
+            quality['sharpness'],
+            -scene_change_rate,  # negated: more than 5 changes per second
+            video_info.get('width', 0),
+            video_info.get('height', 0),
+        ]) < VIDEO_THRESHOLDS
+        flags = np.array([below[0], below[1], below[2] | below[3]])
+        
+        score = np.clip(100.0 - flags @ VIDEO_PENALTIES, 0, 100)
+        confidence = min(0.95, 0.7 + flags @ VIDEO_CONFIDENCE_GAINS)
+        
+        # Build manipulation indicators list
+        manipulation_indicators = [
+            indicator for indicator, flagged in zip(VIDEO_INDICATORS, flags) if flagged
+        ]
+        
+        # Store result
+        result = VideoAnalysisResult(
+            score=score,
+            confidence=confidence,
+            video_info=video_info,
+            frames_analyzed=analysis_data['frames_analyzed'],
+            faces_detected=analysis_data['faces_detected'],
+            face_frames=analysis_data['face_frames'],
+            scene_changes=analysis_data['scene_changes'],
+            quality_metrics=analysis_data['quality_metrics'],
+            manipulation_indicators=manipulation_indicators,
+            metadata={
+                'scene_change_rate': scene_change_rate,
+                'avg_faces_per_frame': analysis_data['faces_detected'] / max(analysis_data['frames_analyzed'], 1),
+            }
+        )
+        
+        # Store in consistent format with text/audio endpoints
+        store.set(_VIDEO, analysis_id, {
+            'status': _COMPLETED,
+            'completed_at': datetime.now(),
+            'credibility_score': score,
+            'confidence': confidence,
+            'result_data': {
+                'video_info': video_info,
+                'frames_analyzed': analysis_data['frames_analyzed'],
+                'faces_detected': analysis_data['faces_detected'],
+                'face_frames': analysis_data['face_frames'],
+                'scene_changes': analysis_data['scene_changes'],
+                'scene_change_count': analysis_data['scene_change_count'],
+                'quality_metrics': analysis_data['quality_metrics'],
+                'manipulation_indicators': manipulation_indicators,
+                'deepfake_detection': {
+                    'score': 100 - score,  # Inverse of credibility
+                },
+                'temporal_analysis': None,  # Placeholder
+                'metadata': {
+                    'scene_change_rate': scene_change_rate,
+                    'avg_faces_per_frame': analysis_data['faces_detected'] / max(analysis_data['frames_analyzed'], 1),
+                }
+            },
+            'file_name': file_name,
+        })
+    except Exception as e:
+        store.set(_VIDEO, analysis_id, {
+            'status': _FAILED,
+            'error': str(e),
+            'file_name': file_name,
+        })
@@ -0,0 +1,45 @@
+"""Tests for the faster-whisper transcription path"""
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+faster_whisper = pytest.importorskip("faster_whisper")
+
+from app.ml.audio_model import SAMPLE_RATE, WhisperTranscriber
+
+
+@pytest.fixture(scope="module")
+def transcriber(tmp_path_factory):
+    """tiny model on CPU, with the batched pipeline _load_model only builds on GPU"""
+    transcriber = WhisperTranscriber(
+        model_size="tiny",
+        device="cpu",
+        backend="faster-whisper",
+        download_root=str(tmp_path_factory.mktemp("whisper"))
+    )
+    try:
+        transcriber.model = faster_whisper.WhisperModel(
+            "tiny",
+            device="cpu",
+            compute_type="int8",
+            download_root=transcriber.download_root
+        )
+    except Exception as e:
+        pytest.skip(f"tiny Whisper model unavailable: {e}")
+    transcriber.pipeline = faster_whisper.BatchedInferencePipeline(model=transcriber.model)
+    return transcriber
+
+
+def test_pipeline_decodes_vad_gate_clips(transcriber):
+    """The gate's clips reach BatchedInferencePipeline in the units it expects"""
+    samples = np.random.default_rng(0).normal(0, 0.01, 3 * SAMPLE_RATE).astype(np.float32)
+    speech = [{'start': SAMPLE_RATE // 2, 'end': 5 * SAMPLE_RATE // 2}]
+    
+    text, segments, language = transcriber._transcribe_faster_whisper(
+        samples, transcriber._speech_clips(speech), return_timestamps=True
+    )
+    
+    assert isinstance(text, str)
+    assert language == "en"
+    # Timestamps are relative to the whole file, so none precede the clip
+    assert all(seg['start'] >= 0.5 for seg in segments)